@@ -1,39 +1,123 @@
 import json
+import os
+import threading
+from types import MappingProxyType
 
-def load_config():
+CONFIG_PATH = "demo-config.json"
+
+# Seconds between stat() checks while a config file is watched
+POLL_INTERVAL = 1.0
+
+REDACTED = "***REDACTED***"
+SENSITIVE_FIELDS = {"database": ("user", "password")}
+
+# path -> ((mtime_ns, size), read-only config); paths being watched skip the stat()
+_cache = {}
+# path -> (poll thread, stop event), one watcher per path
+_watchers = {}
+_lock = threading.Lock()
+
+def _freeze(value):
+    # Read-only view of parsed JSON: objects become MappingProxyType, arrays tuples
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _read_config(path):
     try:
-        with open("demo-config.json", "r") as file:
+        with open(path, "r") as file:
             config = json.load(file)
         
         # Validate config structure
         if not isinstance(config, dict):
             raise ValueError("Config must be a dictionary")
         
-        return config
+        return _freeze(config)
     except FileNotFoundError:
-        raise FileNotFoundError("demo-config.json not found")
+        raise FileNotFoundError(f"{path} not found")
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in config file: {e}")
 
+def _reload_if_changed(path):
+    # Parse the file only if its mtime or size differs from the cached copy
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{path} not found")
+    key = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with _lock:
+        cached = _cache.get(path)
+        if cached is None or cached[0] != key:
+            cached = _cache[path] = (key, _read_config(path))
+        return cached[1]
+
+def load_config(path=CONFIG_PATH):
+    # Return the parsed config as a read-only mapping, shared between callers. The file
+    # is re-parsed only after it changes; while it is watched, this is a dict lookup.
+    if path in _watchers:
+        cached = _cache.get(path)
+        if cached is not None:
+            return cached[1]
+    return _reload_if_changed(path)
+
+def watch_config(path=CONFIG_PATH, interval=POLL_INTERVAL):
+    # Poll the file from a daemon thread and reload it when it changes, so load_config()
+    # never touches the disk. Returns a threading.Event; set it to stop watching.
+    # Watching a path that is already watched returns the existing watcher's event.
+    load_config(path)
+    
+    def poll():
+        while not stop.wait(interval):
+            try:
+                _reload_if_changed(path)
+            except (OSError, ValueError):
+                # Missing or half-written file: keep serving the last good config
+                pass
+        with _lock:
+            # A newer watcher may already have replaced this one
+            if _watchers.get(path, (None, None))[1] is stop:
+                del _watchers[path]
+    
+    with _lock:
+        watcher = _watchers.get(path)
+        if watcher is not None and not watcher[1].is_set():
+            return watcher[1]
+        stop = threading.Event()
+        thread = threading.Thread(target=poll, name=f"watch {path}", daemon=True)
+        _watchers[path] = (thread, stop)
+    thread.start()
+    return stop
+
+def redact(config):
+    # Copy of the top level with sensitive fields replaced; unchanged sections are
+    # shared with config rather than deep-copied. Returns (display config, found)
+    display_config = dict(config)
+    has_sensitive_data = False
+    for section, fields in SENSITIVE_FIELDS.items():
+        values = display_config.get(section)
+        if not isinstance(values, MappingProxyType):
+            continue
+        hidden = {field: REDACTED for field in fields if field in values}
+        if hidden:
+            display_config[section] = {**values, **hidden}
+            has_sensitive_data = True
+    return display_config, has_sensitive_data
+
 if __name__ == "__main__":
     config = load_config()
     print("Config loaded successfully!")
     
-    # Create a copy for display and check for sensitive data
-    display_config = json.loads(json.dumps(config))
-    has_sensitive_data = False
-    
     # Check and redact sensitive information
-    if "database" in display_config:
-        if "user" in display_config["database"]:
-            display_config["database"]["user"] = "***REDACTED***"
-            has_sensitive_data = True
-        if "password" in display_config["database"]:
-            display_config["database"]["password"] = "***REDACTED***"
-            has_sensitive_data = True
+    display_config, has_sensitive_data = redact(config)
     
     if has_sensitive_data:
         print("\n⚠️  WARNING: Config file contains sensitive credentials (user/password)")
     
     print("\nConfiguration content:")
-    print(json.dumps(display_config, indent=4))
\ No newline at end of file
+    print(json.dumps(display_config, indent=4, default=dict))
\ No newline at end of file
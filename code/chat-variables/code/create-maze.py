@@ -1,25 +1,65 @@
-def render_maze_with_walls(grid):
-    rows = len(grid)
-    cols = len(grid[0])
-
-    # Top border
-    print("┌" + "───┬" * (cols - 1) + "───┐")
-
-    for r in range(rows):
-        # Row of cells
-        row_line = "│"
-        for c in range(cols):
-            if grid[r][c] == 1:
-                row_line += " █ │"   # wall cell
-            else:
-                row_line += "   │"   # open cell
-        print(row_line)
-
-        # Row separator (or bottom border)
-        if r < rows - 1:
-            print("├" + "───┼" * (cols - 1) + "───┤")
-        else:
-            print("└" + "───┴" * (cols - 1) + "───┘")
+import sys
+from itertools import islice, repeat
+
+# Glyph per cell value; anything other than 1 renders as an open cell
+WALL_CELL = " █ │"
+OPEN_CELL = "   │"
+PATH_CELL = " • │"
+CELL_GLYPHS = {1: WALL_CELL}
+
+# Grid rows rendered per write() when streaming (None writes the whole frame at once)
+CHUNK_ROWS = 256
+
+def maze_borders(cols):
+    # Top border, row separator and bottom border, built once per frame
+    top = "┌" + "───┬" * (cols - 1) + "───┐\n"
+    separator = "├" + "───┼" * (cols - 1) + "───┤\n"
+    bottom = "└" + "───┴" * (cols - 1) + "───┘\n"
+    return top, separator, bottom
+
+def cell_line(row, path_cols=None):
+    # One row of cells; columns in path_cols are drawn as path cells
+    glyphs = map(CELL_GLYPHS.get, row, repeat(OPEN_CELL))
+    if path_cols:
+        glyphs = list(glyphs)
+        for c in path_cols:
+            glyphs[c] = PATH_CELL
+    return "│" + "".join(glyphs) + "\n"
+
+def iter_maze_lines(grid, path=None):
+    # Yield the frame line by line; grid can be any iterable of rows, even a generator.
+    # path is an optional sequence of (row, col) cells to overlay, e.g. a solver's result
+    path_cols = {}
+    for r, c in path or ():
+        path_cols.setdefault(r, []).append(c)
+
+    rows = iter(grid)
+    row = next(rows, None)
+    if row is None:
+        return
+    top, separator, bottom = maze_borders(len(row))
+
+    yield top
+    yield cell_line(row, path_cols.get(0))
+    for r, row in enumerate(rows, 1):
+        yield separator
+        yield cell_line(row, path_cols.get(r))
+    yield bottom
+
+def render_maze_with_walls(grid, out=None, chunk_rows=CHUNK_ROWS, path=None):
+    # Write the frame to any text stream (default stdout), chunk_rows grid rows per write
+    out = out or sys.stdout
+    lines = iter_maze_lines(grid, path)
+    if chunk_rows is None:
+        out.write("".join(lines))
+        return
+
+    # Each grid row is two lines (cells and separator), plus the top border
+    size = 2 * chunk_rows
+    chunk = "".join(islice(lines, size + 1))
+    while chunk:
+        out.write(chunk)
+        chunk = "".join(islice(lines, size))
 
 maze1 = [
     [0, 0, 1, 0, 0],
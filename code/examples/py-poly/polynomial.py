@@ -5,8 +5,763 @@ A comprehensive library for polynomial operations including arithmetic,
 calculus operations, and various utility functions.
 """
 
-from typing import List, Union, Tuple
+from typing import Iterable, Iterator, List, Union, Tuple, Sequence
+from array import array
+from collections import OrderedDict
+from fractions import Fraction
+from itertools import islice
+import cmath
 import math
+import struct
+import sys
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy is optional; batch evaluation falls back to pure Python
+    _np = None
+
+
+# Scalars accepted by the arithmetic operators; int and Fraction are exact
+_SCALAR_TYPES = (int, float, Fraction)
+
+
+def _is_exact_scalar(x) -> bool:
+    """Return True for scalars that keep exact-mode polynomials exact."""
+    return isinstance(x, (int, Fraction))
+
+
+def _is_raw_bytes(x) -> bool:
+    """
+    Return True for bytes, bytearray and byte-format memoryviews.
+    
+    These are not points: from_buffer() and from_bytes() read them as
+    coefficient storage, so evaluation rejects them instead of evaluating at
+    byte values. Cast the view to the element type first, e.g.
+    memoryview(data).cast('d').
+    """
+    if isinstance(x, (bytes, bytearray)):
+        return True
+    return isinstance(x, memoryview) and x.format in ('B', 'b', 'c')
+
+
+def _is_batch(x) -> bool:
+    """Return True if x is a container of points rather than a single value (never raw bytes)."""
+    if isinstance(x, (list, tuple, array)):
+        return True
+    if isinstance(x, memoryview):
+        return not _is_raw_bytes(x)
+    return _np is not None and isinstance(x, _np.ndarray)
+
+
+# Operand sizes (number of coefficients) at which multiplication switches
+# from the schoolbook loop to Karatsuba, and from Karatsuba to FFT.
+KARATSUBA_THRESHOLD = 32
+FFT_THRESHOLD = 1024
+
+# Outer polynomials up to this many coefficients are composed with an affine
+# inner polynomial by a direct Taylor shift; larger ones use divide and conquer.
+TAYLOR_SHIFT_THRESHOLD = 512
+
+# Divisor and quotient sizes (number of coefficients) from which divmod
+# switches from long division to a Newton-iteration reciprocal.
+FAST_DIVISION_THRESHOLD = 1536
+
+# Points per batch when evaluating over a stream of points.
+STREAM_CHUNK_SIZE = 4096
+
+# The FFT product is only accepted if its worst-case rounding error is below
+# this fraction of the largest result coefficient; otherwise Karatsuba is used.
+FFT_TOLERANCE = 1e-9
+
+# Binary format of to_bytes(): a 24-byte little-endian header (magic, format
+# version, dtype, degree, payload size) followed by the coefficients, padded
+# to a multiple of 8 bytes. float64 payloads are raw doubles; fraction
+# payloads are ASCII "numerator/denominator" pairs separated by spaces.
+_BINARY_HEADER = struct.Struct('<4sBB2xQQ')
+_BINARY_MAGIC = b'POLY'
+_BINARY_VERSION = 1
+_DTYPE_FLOAT64 = 1
+_DTYPE_FRACTION = 2
+
+# repr() and str() show at most this many leading and trailing terms (None
+# shows every term); to_string() takes the same limit per call.
+REPR_MAX_TERMS = None
+
+# evaluate_certified() accepts the compensated Horner value when its error
+# bound is at most this fraction of the value; otherwise the point is
+# evaluated exactly with Fractions.
+CERTIFIED_RTOL = 1e-12
+
+# Unit roundoff of IEEE double precision
+_UNIT_ROUNDOFF = 2.0 ** -53
+
+# Correctly rounded a * b + c (Python 3.13+); otherwise products are split
+_fma = getattr(math, 'fma', None)
+
+
+def _multiply_schoolbook(a: Sequence[float], b: Sequence[float]) -> List[float]:
+    """Multiply coefficient lists with the O(n*m) double loop."""
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x == 0:
+            continue
+        for j, y in enumerate(b):
+            result[i + j] += x * y
+    return result
+
+
+def _add_shifted(target: List[float], values: Sequence[float], shift: int) -> None:
+    """Add values into target starting at index shift."""
+    for i, v in enumerate(values, shift):
+        target[i] += v
+
+
+def _multiply_karatsuba(a: Sequence[float], b: Sequence[float]) -> List[float]:
+    """Multiply coefficient lists with Karatsuba's O(n^1.585) algorithm."""
+    if len(a) < len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    
+    if m <= KARATSUBA_THRESHOLD:
+        return _multiply_schoolbook(a, b)
+    
+    result = [0] * (n + m - 1)
+    
+    # Unbalanced operands: multiply b by m-sized slices of a
+    if m <= n // 2:
+        for start in range(0, n, m):
+            _add_shifted(result, _multiply_karatsuba(a[start:start + m], b), start)
+        return result
+    
+    half = n // 2
+    a_low, a_high = a[:half], a[half:]
+    b_low, b_high = b[:half], b[half:]
+    
+    low = _multiply_karatsuba(a_low, b_low)
+    high = _multiply_karatsuba(a_high, b_high)
+    
+    a_sum = list(a_high)
+    _add_shifted(a_sum, a_low, 0)
+    b_sum = list(b_high) + [0] * max(0, len(b_low) - len(b_high))
+    _add_shifted(b_sum, b_low, 0)
+    middle = _multiply_karatsuba(a_sum, b_sum)
+    
+    for i, v in enumerate(low):
+        middle[i] -= v
+    for i, v in enumerate(high):
+        middle[i] -= v
+    
+    _add_shifted(result, low, 0)
+    _add_shifted(result, middle[:len(result) - half], half)
+    _add_shifted(result, high, 2 * half)
+    return result
+
+
+def _fft(values: List[complex], invert: bool = False) -> None:
+    """In-place iterative radix-2 FFT; len(values) must be a power of two."""
+    n = len(values)
+    
+    # Bit-reversal permutation
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            values[i], values[j] = values[j], values[i]
+    
+    sign = 1 if invert else -1
+    length = 2
+    while length <= n:
+        half = length // 2
+        roots = [cmath.exp(sign * 2j * math.pi * k / length) for k in range(half)]
+        for start in range(0, n, length):
+            low = values[start:start + half]
+            high = [v * w for v, w in zip(values[start + half:start + length], roots)]
+            values[start:start + half] = [u + v for u, v in zip(low, high)]
+            values[start + half:start + length] = [u - v for u, v in zip(low, high)]
+        length <<= 1
+    
+    if invert:
+        values[:] = [v / n for v in values]
+
+
+def _norm2(values: Sequence[float]) -> float:
+    """Euclidean norm, scaled by the largest entry so the squares cannot overflow."""
+    largest = max(abs(v) for v in values)
+    if largest == 0 or math.isinf(largest):
+        return largest
+    return largest * math.sqrt(math.fsum((v / largest) ** 2 for v in values))
+
+
+def _two_sum(a: float, b: float) -> Tuple[float, float]:
+    """Return (s, e) with s = fl(a + b) and a + b = s + e exactly (Knuth's TwoSum)."""
+    s = a + b
+    z = s - a
+    return s, (a - (s - z)) + (b - z)
+
+
+def _two_product(a: float, b: float) -> Tuple[float, float]:
+    """Return (p, e) with p = fl(a * b) and a * b = p + e exactly (Dekker's TwoProduct)."""
+    p = a * b
+    if _fma is not None:
+        return p, _fma(a, b, -p)
+    
+    # Veltkamp splitting into 26-bit halves, 134217729 = 2**27 + 1
+    t = 134217729.0 * a
+    a_high = t - (t - a)
+    a_low = a - a_high
+    t = 134217729.0 * b
+    b_high = t - (t - b)
+    b_low = b - b_high
+    return p, a_low * b_low - (((p - a_high * b_high) - a_low * b_high) - a_high * b_low)
+
+
+def _gamma(n: int) -> float:
+    """Standard rounding-error constant n*u / (1 - n*u)."""
+    return n * _UNIT_ROUNDOFF / (1 - n * _UNIT_ROUNDOFF)
+
+
+def _multiply_fft(a: Sequence[float], b: Sequence[float]) -> Union[List[float], None]:
+    """
+    Multiply coefficient lists by FFT convolution.
+    
+    Returns None when the rounding-error bound of the transform is too large
+    relative to the result, so the caller can fall back to an exact method.
+    """
+    result_len = len(a) + len(b) - 1
+    size = 1
+    while size < result_len:
+        size <<= 1
+    
+    fa = [complex(x) for x in a] + [0j] * (size - len(a))
+    fb = [complex(x) for x in b] + [0j] * (size - len(b))
+    _fft(fa)
+    _fft(fb)
+    product = [x * y for x, y in zip(fa, fb)]
+    _fft(product, invert=True)
+    result = [v.real for v in product[:result_len]]
+    
+    # Error bound for floating-point FFT convolution:
+    # |error| <= c * eps * log2(size) * ||a||_2 * ||b||_2
+    norm_a = _norm2(a)
+    norm_b = _norm2(b)
+    error_bound = 8 * 2.220446049250313e-16 * math.log2(size) * norm_a * norm_b
+    largest = max(abs(v) for v in result)
+    if not error_bound <= FFT_TOLERANCE * largest:
+        return None
+    
+    return result
+
+
+def _multiply(a: Sequence[float], b: Sequence[float]) -> List[float]:
+    """
+    Multiply two coefficient sequences, choosing the algorithm by size.
+    
+    Schoolbook is used for small operands, Karatsuba for medium ones and FFT
+    convolution for large real-valued ones (with an accuracy guard).
+    """
+    smaller = min(len(a), len(b))
+    if smaller <= KARATSUBA_THRESHOLD:
+        return _multiply_schoolbook(a, b)
+    
+    if smaller >= FFT_THRESHOLD and all(isinstance(c, (int, float)) for c in a) \
+            and all(isinstance(c, (int, float)) for c in b):
+        result = _multiply_fft(a, b)
+        if result is not None:
+            return result
+    
+    return _multiply_karatsuba(a, b)
+
+
+def _divmod_schoolbook(dividend: Sequence[float],
+                       divisor: Sequence[float]) -> Tuple[List[float], List[float]]:
+    """
+    Long division of coefficient sequences (divisor's leading term nonzero).
+    
+    Returns:
+        Tuple of (quotient, remainder) coefficient lists; either may be empty
+    """
+    dividend = list(dividend)
+    
+    if len(dividend) < len(divisor):
+        return [], dividend
+    
+    quotient = []
+    
+    while len(dividend) >= len(divisor):
+        # Divide leading terms
+        coef = dividend[-1] / divisor[-1]
+        quotient.append(coef)
+        
+        # Subtract divisor * coef from dividend
+        offset = len(dividend) - len(divisor)
+        for i in range(len(divisor)):
+            dividend[offset + i] -= coef * divisor[i]
+        
+        # Remove leading term
+        dividend.pop()
+    
+    quotient.reverse()
+    return quotient, dividend
+
+
+def _series_reciprocal(f: Sequence[float], length: int,
+                       start: Sequence[float] = ()) -> List[float]:
+    """
+    Return g with f * g = 1 mod x^length by Newton iteration (f[0] != 0).
+    
+    Each step doubles the number of correct terms: g <- g + g * (1 - f*g).
+    A previously computed, shorter reciprocal can be passed as start.
+    """
+    g = list(start) if start else [1 / f[0]]
+    
+    while len(g) < length:
+        known = len(g)
+        size = min(2 * known, length)
+        # f*g = 1 + x^known * e (mod x^size); only e is needed
+        error = _multiply(f[:size], g)[known:size]
+        correction = _multiply(g, error)[:size - known]
+        g.extend(-c for c in correction)
+    
+    return g[:length]
+
+
+def _divmod_newton(dividend: Sequence[float], divisor: Sequence[float],
+                   reciprocal: Sequence[float]) -> Tuple[List[float], List[float]]:
+    """
+    Divide using the reciprocal of the reversed divisor.
+    
+    With k = len(dividend) - len(divisor) + 1 quotient terms, the reversed
+    quotient is rev(dividend) * reciprocal mod x^k, so division costs two
+    multiplications instead of k passes over the divisor.
+    
+    Args:
+        dividend: Dividend coefficients
+        divisor: Divisor coefficients (leading term nonzero)
+        reciprocal: At least k terms of 1 / rev(divisor)
+        
+    Returns:
+        Tuple of (quotient, remainder) coefficient lists
+    """
+    k = len(dividend) - len(divisor) + 1
+    if k <= 0:
+        return [], list(dividend)
+    
+    top = list(dividend[len(divisor) - 1:])
+    top.reverse()
+    quotient = _multiply(top, reciprocal[:k])[:k]
+    quotient.reverse()
+    
+    low = len(divisor) - 1
+    product = _multiply(divisor, quotient)
+    remainder = [a - b for a, b in zip(dividend[:low], product)]
+    return quotient, remainder
+
+
+def _use_fast_division(dividend_len: int, divisor_len: int) -> bool:
+    """Return True when Newton division beats long division for these sizes."""
+    quotient_len = dividend_len - divisor_len + 1
+    return min(quotient_len, divisor_len) >= FAST_DIVISION_THRESHOLD
+
+
+def _compose_affine(coeffs: Sequence[float], a: float, b: float) -> List[float]:
+    """
+    Compute p(a*x + b) (a Taylor shift plus scaling) with Horner's method.
+    
+    Multiplying by a linear polynomial is a single pass over the running
+    result, so the whole composition costs O(n^2) scalar operations.
+    """
+    result = [coeffs[-1]]
+    for coef in reversed(coeffs[:-1]):
+        result = ([b * result[0] + coef]
+                  + [a * low + b * high for low, high in zip(result, result[1:])]
+                  + [a * result[-1]])
+    return result
+
+
+def _compose_divide_conquer(coeffs: Sequence[float], inner: Sequence[float]) -> List[float]:
+    """
+    Compute p(q(x)) by splitting p into halves: p_low(q) + q^k * p_high(q).
+    
+    Blocks of coefficients are merged pairwise, level by level, using the
+    precomputed powers q, q^2, q^4, ...; with fast multiplication this does
+    O(M(n*m) log n) work instead of n growing multiplications.
+    """
+    blocks = [[c] for c in coeffs]
+    power = list(inner)
+    
+    while len(blocks) > 1:
+        merged = []
+        for i in range(0, len(blocks) - 1, 2):
+            combined = _multiply(blocks[i + 1], power)
+            _add_shifted(combined, blocks[i], 0)
+            merged.append(combined)
+        if len(blocks) % 2:
+            merged.append(blocks[-1])
+        blocks = merged
+        if len(blocks) > 1:
+            power = _multiply(power, power)
+    
+    return blocks[0]
+
+
+def _root_setup(coeffs: Sequence[float]) -> Tuple[int, List[float]]:
+    """
+    Split off roots at zero and normalize the rest to a monic polynomial.
+    
+    Returns:
+        Tuple of (number of zero roots, monic coefficients in ascending order)
+    """
+    if len(coeffs) == 1:
+        return 0, [1.0]  # constant polynomial: no roots
+    
+    zeros = 0
+    while zeros < len(coeffs) - 1 and abs(coeffs[zeros]) < 1e-10:
+        zeros += 1
+    lead = coeffs[-1]
+    return zeros, [float(c / lead) for c in coeffs[zeros:]]
+
+
+def _initial_roots(monic: Sequence[float]) -> List[complex]:
+    """Spread starting points on a circle whose radius matches the roots' mean size."""
+    n = len(monic) - 1
+    radius = abs(monic[0]) ** (1.0 / n)
+    return [radius * cmath.exp(1j * (2 * math.pi * k / n + 0.4)) for k in range(n)]
+
+
+def _aberth(monic: Sequence[float], tol: float, max_iter: int) -> List[complex]:
+    """
+    Find all roots of a monic polynomial with the Aberth-Ehrlich iteration.
+    
+    All approximations are refined simultaneously; each update is Newton's
+    step corrected by the repulsion from the other current approximations.
+    """
+    n = len(monic) - 1
+    if n == 0:
+        return []
+    
+    roots = _initial_roots(monic)
+    converged = [False] * n
+    lower = monic[-2::-1]  # coefficients below the leading 1, highest first
+    
+    for _ in range(max_iter):
+        done = True
+        for k in range(n):
+            if converged[k]:
+                continue
+            z = roots[k]
+            
+            # Horner's method for p(z) and p'(z) together
+            value, slope = 1.0, 0.0
+            for coef in lower:
+                slope = slope * z + value
+                value = value * z + coef
+            if value == 0:
+                converged[k] = True
+                continue
+            
+            repulsion = sum(1 / (z - other) for j, other in enumerate(roots) if j != k)
+            denominator = slope / value - repulsion
+            if denominator == 0:
+                roots[k] = z * (1 + 1e-8) + 1e-8
+                done = False
+                continue
+            
+            step = 1 / denominator
+            roots[k] = z - step
+            if abs(step) <= tol * max(1.0, abs(roots[k])):
+                converged[k] = True
+            else:
+                done = False
+        if done:
+            break
+    
+    return roots
+
+
+def _aberth_batch_numpy(monics: List[List[float]], tol: float, max_iter: int) -> List[List[complex]]:
+    """Run the Aberth-Ehrlich iteration on same-degree monic polynomials in lock-step."""
+    coeffs = _np.array(monics, dtype=complex)
+    batch, n = coeffs.shape[0], coeffs.shape[1] - 1
+    
+    radius = _np.abs(coeffs[:, 0]) ** (1.0 / n)
+    angles = 2 * _np.pi * _np.arange(n) / n + 0.4
+    roots = radius[:, None] * _np.exp(1j * angles)[None, :]
+    active = _np.ones((batch, n), dtype=bool)
+    off_diagonal = ~_np.eye(n, dtype=bool)
+    
+    for _ in range(max_iter):
+        value = _np.ones_like(roots)
+        slope = _np.zeros_like(roots)
+        for k in range(n - 1, -1, -1):
+            slope = slope * roots + value
+            value = value * roots + coeffs[:, k:k + 1]
+        
+        differences = roots[:, :, None] - roots[:, None, :]
+        differences[:, ~off_diagonal] = 1.0
+        repulsion = _np.where(off_diagonal, 1 / differences, 0).sum(axis=2)
+        
+        with _np.errstate(divide='ignore', invalid='ignore'):
+            step = 1 / (slope / value - repulsion)
+        step = _np.where(_np.isfinite(step) & active, step, 0)
+        roots = roots - step
+        
+        active &= _np.abs(step) > tol * _np.maximum(1.0, _np.abs(roots))
+        if not active.any():
+            break
+    
+    return [list(row) for row in roots]
+
+
+def _primitive_integer(coeffs: Sequence[Fraction]) -> List[int]:
+    """
+    Scale rational coefficients to coprime integers with a positive leading term.
+    
+    The coefficients must not all be zero.
+    """
+    scale = math.lcm(*(c.denominator for c in coeffs))
+    ints = [c.numerator * (scale // c.denominator) for c in coeffs]
+    content = math.gcd(*ints)
+    if ints[-1] < 0:
+        content = -content
+    return [c // content for c in ints]
+
+
+def _pseudo_remainder(a: List[int], b: List[int]) -> List[int]:
+    """
+    Return prem(a, b) = lc(b)^(deg a - deg b + 1) * a mod b in integers.
+    
+    Returns:
+        Remainder coefficients with zero leading terms removed (empty for 0)
+    """
+    lead = b[-1]
+    remainder = list(a)
+    steps = len(a) - len(b) + 1
+    
+    while len(remainder) >= len(b):
+        coef = remainder[-1]
+        offset = len(remainder) - len(b)
+        remainder = [lead * c for c in remainder]
+        for i, c in enumerate(b):
+            remainder[offset + i] -= coef * c
+        remainder.pop()
+        steps -= 1
+        while remainder and remainder[-1] == 0:
+            remainder.pop()
+    
+    factor = lead ** steps
+    return [factor * c for c in remainder]
+
+
+def _gcd_subresultant(a: List[int], b: List[int]) -> List[int]:
+    """
+    GCD of primitive integer polynomials by the subresultant PRS.
+    
+    Each remainder is divided exactly by g * h^delta, which keeps
+    coefficient growth polynomial instead of exponential (Cohen,
+    Algorithm 3.3.1).
+    
+    Returns:
+        The primitive GCD with a positive leading coefficient
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    g = h = 1
+    
+    while True:
+        delta = len(a) - len(b)
+        remainder = _pseudo_remainder(a, b)
+        if not remainder:
+            break
+        if len(remainder) == 1:
+            return [1]
+        
+        a = b
+        divisor = g * h ** delta
+        b = [c // divisor for c in remainder]
+        g = a[-1]
+        # h = g^delta / h^(delta - 1); unchanged when delta is 0
+        if delta:
+            h = g ** delta // h ** (delta - 1)
+    
+    return _primitive_integer([Fraction(c) for c in b])
+
+
+def _newton_order(points: Sequence[float]) -> List[int]:
+    """
+    Order points for Newton interpolation, checking that they are distinct.
+    
+    Sorted points are visited in bit-reversed order, which spreads
+    consecutive nodes over the interval like a Leja ordering and keeps the
+    divided differences well scaled.
+    """
+    ordered = sorted(range(len(points)), key=points.__getitem__)
+    for a, b in zip(ordered, ordered[1:]):
+        if points[a] == points[b]:
+            raise ValueError("Interpolation points must be distinct")
+    
+    bits = max(1, (len(points) - 1).bit_length())
+    reversed_positions = sorted(range(len(points)),
+                                key=lambda i: int(format(i, f'0{bits}b')[::-1], 2))
+    return [ordered[i] for i in reversed_positions]
+
+
+def _interpolate_newton(xs: Sequence[float], ys: Sequence[float]) -> List[float]:
+    """Interpolate with Newton divided differences in O(n^2)."""
+    order = _newton_order(xs)
+    nodes = [xs[i] for i in order]
+    coef = [ys[i] for i in order]
+    n = len(nodes)
+    
+    for j in range(1, n):
+        coef[j:] = [(coef[i] - coef[i - 1]) / (nodes[i] - nodes[i - j]) for i in range(j, n)]
+    
+    # Expand c0 + (x - x0)(c1 + (x - x1)(c2 + ...)) from the inside out
+    result = [coef[-1]]
+    for k in range(n - 2, -1, -1):
+        a = nodes[k]
+        result = ([coef[k] - a * result[0]]
+                  + [low - a * high for low, high in zip(result, result[1:])]
+                  + [result[-1]])
+    return result
+
+
+def _stream_chunks(xs: Iterable[float], chunk_size: int) -> Iterator[List[float]]:
+    """Read an iterable (points, polynomials, ...) in lists of at most chunk_size items."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    iterator = iter(xs)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _format_term(i: int, coef, exact: bool) -> str:
+    """Format the term coef·x^i, with its sign as the first character."""
+    if exact and coef.denominator != 1:
+        sign = "-" if coef < 0 else ""
+        if i == 0:
+            return f"{coef}"
+        if i == 1:
+            return f"{sign}({abs(coef)})x"
+        return f"{sign}({abs(coef)})x^{i}"
+    if i == 0:
+        return f"{coef:g}" if not exact else f"{coef}"
+    if (coef == 1) if exact else abs(coef - 1) < 1e-10:
+        return "x" if i == 1 else f"x^{i}"
+    if (coef == -1) if exact else abs(coef + 1) < 1e-10:
+        return "-x" if i == 1 else f"-x^{i}"
+    text = f"{coef:g}" if not exact else f"{coef}"
+    return f"{text}x" if i == 1 else f"{text}x^{i}"
+
+
+def _join_terms(terms: Sequence[str]) -> str:
+    """Join formatted terms with " + " / " - " in one pass."""
+    if not terms:
+        return "0"
+    parts = [terms[0]]
+    for term in terms[1:]:
+        if term[0] == '-':
+            parts.append(" - ")
+            parts.append(term[1:])
+        else:
+            parts.append(" + ")
+            parts.append(term)
+    return "".join(parts)
+
+
+class CalculusCache:
+    """
+    Bounded LRU cache of derivative and antiderivative coefficients.
+    
+    Shared by all Polynomial instances once enabled with enable_shared_cache();
+    entries are keyed by the operation and the raw coefficient bytes, so equal
+    polynomials held in different objects share one entry.
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept before the least
+                     recently used one is evicted
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key):
+        """Return the cached value for key (marking it recently used), or None."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key, value) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def info(self) -> dict:
+        """Return the hit/miss counters and current size."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+
+
+_shared_cache: Union[CalculusCache, None] = None
+
+
+def enable_shared_cache(maxsize: int = 1024) -> CalculusCache:
+    """
+    Turn on the shared derivative/antiderivative LRU cache.
+    
+    Args:
+        maxsize: Maximum number of cached results
+        
+    Returns:
+        The active cache (for inspecting its counters)
+    """
+    global _shared_cache
+    _shared_cache = CalculusCache(maxsize)
+    return _shared_cache
+
+
+def disable_shared_cache() -> None:
+    """Turn off and discard the shared derivative/antiderivative cache."""
+    global _shared_cache
+    _shared_cache = None
+
+
+def shared_cache_info() -> Union[dict, None]:
+    """Return the shared cache counters, or None if the cache is disabled."""
+    return _shared_cache.info() if _shared_cache is not None else None
 
 
 class Polynomial:
@@ -15,106 +770,358 @@ class Polynomial:
     
     Coefficients are stored in ascending order of powers:
     [a0, a1, a2, ...] represents a0 + a1*x + a2*x^2 + ...
+    
+    By default coefficients are floats. In exact mode they are Fractions,
+    arithmetic is exact and only true zeros are trimmed. Combining an exact
+    polynomial with a float polynomial or scalar gives a float result.
     """
     
-    def __init__(self, coefficients: List[float]):
+    __slots__ = ('_coeffs', '_cache')
+    
+    def __init__(self, coefficients: Sequence[float], exact: bool = False):
         """
         Initialize a polynomial with given coefficients.
         
         Args:
             coefficients: List of coefficients in ascending order of powers
                          [a0, a1, a2] represents a0 + a1*x + a2*x^2
+            exact: Store the coefficients as Fractions (ints, Fractions and
+                   floats are converted without rounding)
         """
-        if not coefficients:
-            self.coefficients = [0.0]
+        if exact:
+            coeffs = [Fraction(c) for c in coefficients]
+            if not coeffs:
+                coeffs.append(Fraction(0))
+        else:
+            coeffs = array('d', coefficients)
+            if not coeffs:
+                coeffs.append(0.0)
+        self._coeffs = coeffs
+        self._cache = None
+        
+        # Remove leading zeros but keep at least one coefficient
+        length = self._trimmed_length(coeffs, exact)
+        if length < len(coeffs):
+            del coeffs[length:]
+    
+    @staticmethod
+    def _trimmed_length(coeffs: Sequence[float], exact: bool = False) -> int:
+        """Return the length of coeffs without (near-)zero leading terms (at least 1)."""
+        length = len(coeffs)
+        if exact:
+            while length > 1 and coeffs[length - 1] == 0:
+                length -= 1
         else:
-            # Remove leading zeros but keep at least one coefficient
-            self.coefficients = list(coefficients)
-            while len(self.coefficients) > 1 and abs(self.coefficients[-1]) < 1e-10:
-                self.coefficients.pop()
+            while length > 1 and abs(coeffs[length - 1]) < 1e-10:
+                length -= 1
+        return length
+    
+    @classmethod
+    def _from_array(cls, coeffs: Union[array, memoryview, list, tuple]) -> 'Polynomial':
+        """
+        Wrap already-trimmed storage without copying it.
+        
+        array('d') and memoryview storage is float mode; a list or tuple of
+        Fractions is exact mode.
+        """
+        poly = cls.__new__(cls)
+        poly._coeffs = coeffs
+        poly._cache = None
+        return poly
+    
+    @classmethod
+    def from_buffer(cls, buffer) -> 'Polynomial':
+        """
+        Create a polynomial that shares memory with an existing buffer.
+        
+        No coefficients are copied: the polynomial keeps a memoryview of the
+        buffer, so later writes to the buffer are visible through it (but not
+        to derivatives or the text already cached on the instance).
+        
+        Args:
+            buffer: A contiguous buffer of C doubles (array('d'), bytes,
+                    bytearray, mmap, NumPy float64 array, ...) in ascending
+                    order of powers
+                    
+        Returns:
+            A Polynomial backed by the buffer
+        """
+        view = memoryview(buffer)
+        if view.format != 'd':
+            view = view.cast('B').cast('d')
+        if len(view) == 0:
+            return cls._from_array(array('d', [0.0]))
+        return cls._from_array(view[:cls._trimmed_length(view)])
+    
+    def __reduce__(self):
+        """Pickle as a packed array of doubles, also for buffer-backed instances."""
+        if self.exact:
+            return (self.__class__, (list(self._coeffs), True))
+        return (self.__class__, (array('d', self._coeffs),))
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the polynomial to the compact binary format.
+        
+        Float coefficients are written as little-endian doubles (8 bytes each
+        after a 24-byte header); exact coefficients as numerator/denominator
+        text.
+        
+        Returns:
+            The encoded polynomial
+        """
+        degree = len(self._coeffs) - 1
+        if self.exact:
+            payload = " ".join(f"{c.numerator}/{c.denominator}" for c in self._coeffs).encode('ascii')
+            dtype = _DTYPE_FRACTION
+        else:
+            coeffs = self._coeffs
+            if sys.byteorder == 'big':
+                coeffs = array('d', coeffs)
+                coeffs.byteswap()
+            payload = coeffs.tobytes()
+            dtype = _DTYPE_FLOAT64
+        
+        header = _BINARY_HEADER.pack(_BINARY_MAGIC, _BINARY_VERSION, dtype, degree, len(payload))
+        return header + payload + b" " * (-len(payload) % 8)
+    
+    @classmethod
+    def from_bytes(cls, data) -> 'Polynomial':
+        """
+        Read a polynomial written by to_bytes().
+        
+        Float coefficients are not copied: the polynomial is a read-only view
+        of data (as with from_buffer), so reading from a bytes object or an
+        mmap costs O(1) regardless of degree. Trailing bytes after the
+        record are ignored.
+        
+        Args:
+            data: bytes, bytearray, memoryview, mmap or any other buffer
+            
+        Returns:
+            The decoded Polynomial
+        """
+        view = memoryview(data).cast('B')
+        if len(view) < _BINARY_HEADER.size:
+            raise ValueError("Truncated polynomial data")
+        
+        magic, version, dtype, degree, size = _BINARY_HEADER.unpack_from(view)
+        if magic != _BINARY_MAGIC:
+            raise ValueError("Not binary polynomial data")
+        if version != _BINARY_VERSION:
+            raise ValueError(f"Unsupported binary polynomial version {version}")
+        
+        start = _BINARY_HEADER.size
+        if len(view) < start + size:
+            raise ValueError("Truncated polynomial data")
+        payload = view[start:start + size]
+        
+        if dtype == _DTYPE_FLOAT64:
+            if size != 8 * (degree + 1):
+                raise ValueError("Corrupt polynomial data: size does not match degree")
+            if sys.byteorder == 'big':
+                coeffs = array('d')
+                coeffs.frombytes(payload)
+                coeffs.byteswap()
+                return cls._from_array(coeffs)
+            return cls.from_buffer(payload)
+        
+        if dtype == _DTYPE_FRACTION:
+            coeffs = [Fraction(term.decode('ascii')) for term in bytes(payload).split()]
+            if len(coeffs) != degree + 1:
+                raise ValueError("Corrupt polynomial data: size does not match degree")
+            return cls(coeffs, exact=True)
+        
+        raise ValueError(f"Unknown polynomial dtype {dtype}")
+    
+    @staticmethod
+    def record_size(data) -> int:
+        """Return the number of bytes the to_bytes() record at the start of data occupies."""
+        size = _BINARY_HEADER.unpack_from(data)[4]
+        return _BINARY_HEADER.size + size + (-size % 8)
+    
+    @property
+    def exact(self) -> bool:
+        """Return True if the coefficients are exact Fractions."""
+        return not isinstance(self._coeffs, (array, memoryview))
+    
+    def _owned_coeffs(self, exact: bool) -> Union[array, list]:
+        """
+        Return private, resizable coefficient storage (copy-on-write for views).
+        
+        Args:
+            exact: Whether the updated polynomial stays in exact mode; if not,
+                   exact coefficients are converted to floats first
+        """
+        coeffs = self._coeffs
+        if exact:
+            if not isinstance(coeffs, list):
+                self._coeffs = coeffs = list(coeffs)
+        elif not isinstance(coeffs, array):
+            self._coeffs = coeffs = array('d', coeffs)
+        return coeffs
+    
+    def _trim(self) -> None:
+        """Drop near-zero leading coefficients and cached results after an in-place update."""
+        coeffs = self._coeffs
+        length = self._trimmed_length(coeffs, self.exact)
+        if length < len(coeffs):
+            del coeffs[length:]
+        self._cache = None
+    
+    def _cached(self, key: Tuple, compute) -> Union[memoryview, tuple]:
+        """
+        Return cached coefficients for key, computing them on a miss.
+        
+        Results live in the per-instance cache and, if enabled, the shared
+        LRU cache. They are stored as read-only views (tuples in exact mode)
+        so every Polynomial built on them copies before any in-place update.
+        """
+        exact = self.exact
+        cache = self._cache
+        if cache is not None:
+            coeffs = cache.get(key)
+            if coeffs is not None:
+                return coeffs
+        else:
+            cache = self._cache = {}
+        
+        shared = _shared_cache
+        shared_key = None
+        coeffs = None
+        if shared is not None:
+            identity = tuple(self._coeffs) if exact else self._coeffs.tobytes()
+            shared_key = key + (identity,)
+            coeffs = shared.get(shared_key)
+        
+        if coeffs is None:
+            result = Polynomial(compute(), exact)._coeffs
+            coeffs = tuple(result) if exact else memoryview(result).toreadonly()
+            if shared is not None:
+                shared.put(shared_key, coeffs)
+        
+        cache[key] = coeffs
+        return coeffs
+    
+    def copy(self) -> 'Polynomial':
+        """Return an independent copy of the polynomial."""
+        if self.exact:
+            return Polynomial._from_array(list(self._coeffs))
+        return Polynomial._from_array(array('d', self._coeffs))
+    
+    @property
+    def coefficients(self) -> List[float]:
+        """
+        Return the coefficients in ascending order of powers as a new list.
+        
+        Float polynomials store their coefficients as doubles, so integer
+        inputs come back as floats (use exact=True to keep ints exact).
+        Changing the returned list does not change the polynomial; assign a
+        whole new list to coefficients instead.
+        """
+        if self.exact:
+            return list(self._coeffs)
+        return self._coeffs.tolist()
+    
+    @coefficients.setter
+    def coefficients(self, values: Sequence[float]) -> None:
+        """Replace the coefficients, keeping the storage mode and dropping cached results."""
+        self._coeffs = Polynomial(values, self.exact)._coeffs
+        self._cache = None
     
     @property
     def degree(self) -> int:
         """Return the degree of the polynomial."""
-        if len(self.coefficients) == 1 and abs(self.coefficients[0]) < 1e-10:
+        if len(self._coeffs) == 1 and abs(self._coeffs[0]) < 1e-10:
             return 0
-        return len(self.coefficients) - 1
+        return len(self._coeffs) - 1
     
-    def __repr__(self) -> str:
-        """Return a string representation of the polynomial."""
-        if not self.coefficients or all(abs(c) < 1e-10 for c in self.coefficients):
-            return "0"
-        
-        terms = []
-        for i, coef in enumerate(self.coefficients):
-            if abs(coef) < 1e-10:
+    def _nonzero_terms(self, indices) -> Iterator[str]:
+        """Yield the formatted non-zero terms at the given indices, in order."""
+        coeffs = self._coeffs
+        exact = self.exact
+        for i in indices:
+            coef = coeffs[i]
+            if (coef == 0) if exact else abs(coef) < 1e-10:
                 continue
-            
-            # Format coefficient
-            if i == 0:
-                terms.append(f"{coef:g}")
-            elif abs(coef - 1.0) < 1e-10:
-                if i == 1:
-                    terms.append("x")
-                else:
-                    terms.append(f"x^{i}")
-            elif abs(coef + 1.0) < 1e-10:
-                if i == 1:
-                    terms.append("-x")
-                else:
-                    terms.append(f"-x^{i}")
-            else:
-                if i == 1:
-                    terms.append(f"{coef:g}x")
-                else:
-                    terms.append(f"{coef:g}x^{i}")
-        
-        if not terms:
-            return "0"
-        
-        # Join terms with proper signs
-        result = terms[0]
-        for term in terms[1:]:
-            if term[0] == '-':
-                result += f" - {term[1:]}"
-            else:
-                result += f" + {term}"
+            yield _format_term(i, coef, exact)
+    
+    def to_string(self, max_terms: Union[int, None] = None) -> str:
+        """
+        Return the polynomial as text, e.g. "1 + 2x - x^3".
         
-        return result
+        Runs in time linear in the number of terms and caches the result on
+        the instance until the next in-place update.
+        
+        Args:
+            max_terms: If given, show only the first and last max_terms
+                       non-zero terms with "..." in between
+                       
+        Returns:
+            The formatted polynomial
+        """
+        if self._cache is None:
+            self._cache = {}
+        key = ('repr', max_terms)
+        text = self._cache.get(key)
+        if text is not None:
+            return text
+        
+        n = len(self._coeffs)
+        if max_terms is None:
+            terms = list(self._nonzero_terms(range(n)))
+        else:
+            # Scan only as far as needed from each end
+            terms = list(islice(self._nonzero_terms(range(n)), 2 * max_terms + 1))
+            if len(terms) > 2 * max_terms:
+                head = terms[:max_terms]
+                tail = list(islice(self._nonzero_terms(range(n - 1, -1, -1)), max_terms))
+                terms = head + ["..."] + tail[::-1]
+        
+        text = _join_terms(terms)
+        self._cache[key] = text
+        return text
+    
+    def __repr__(self) -> str:
+        """Return a string representation of the polynomial."""
+        return self.to_string(REPR_MAX_TERMS)
     
     def __str__(self) -> str:
         """Return a string representation of the polynomial."""
-        return self.__repr__()
+        return self.to_string(REPR_MAX_TERMS)
     
     def __eq__(self, other) -> bool:
         """Check if two polynomials are equal."""
         if not isinstance(other, Polynomial):
-            return False
+            return NotImplemented
         
-        if len(self.coefficients) != len(other.coefficients):
+        if len(self._coeffs) != len(other._coeffs):
             return False
         
-        return all(abs(a - b) < 1e-10 for a, b in zip(self.coefficients, other.coefficients))
+        if self.exact and other.exact:
+            return all(a == b for a, b in zip(self._coeffs, other._coeffs))
+        
+        return all(abs(a - b) < 1e-10 for a, b in zip(self._coeffs, other._coeffs))
     
     def __add__(self, other: Union['Polynomial', float]) -> 'Polynomial':
         """Add two polynomials or add a constant to a polynomial."""
-        if isinstance(other, (int, float)):
-            other = Polynomial([other])
+        if isinstance(other, _SCALAR_TYPES):
+            other = Polynomial([other], _is_exact_scalar(other))
         
         if not isinstance(other, Polynomial):
-            raise TypeError("Can only add Polynomial or number")
+            return NotImplemented
         
         # Determine the length of the result
-        max_len = max(len(self.coefficients), len(other.coefficients))
-        result = [0.0] * max_len
+        max_len = max(len(self._coeffs), len(other._coeffs))
+        result = [0] * max_len
         
-        for i in range(len(self.coefficients)):
-            result[i] += self.coefficients[i]
+        for i in range(len(self._coeffs)):
+            result[i] += self._coeffs[i]
         
-        for i in range(len(other.coefficients)):
-            result[i] += other.coefficients[i]
+        for i in range(len(other._coeffs)):
+            result[i] += other._coeffs[i]
         
-        return Polynomial(result)
+        return Polynomial(result, self.exact and other.exact)
     
     def __radd__(self, other: Union['Polynomial', float]) -> 'Polynomial':
         """Right addition."""
@@ -122,52 +1129,98 @@ class Polynomial:
     
     def __sub__(self, other: Union['Polynomial', float]) -> 'Polynomial':
         """Subtract two polynomials or subtract a constant from a polynomial."""
-        if isinstance(other, (int, float)):
-            other = Polynomial([other])
+        if isinstance(other, _SCALAR_TYPES):
+            other = Polynomial([other], _is_exact_scalar(other))
         
         if not isinstance(other, Polynomial):
-            raise TypeError("Can only subtract Polynomial or number")
+            return NotImplemented
         
-        max_len = max(len(self.coefficients), len(other.coefficients))
-        result = [0.0] * max_len
+        max_len = max(len(self._coeffs), len(other._coeffs))
+        result = [0] * max_len
         
-        for i in range(len(self.coefficients)):
-            result[i] += self.coefficients[i]
+        for i in range(len(self._coeffs)):
+            result[i] += self._coeffs[i]
         
-        for i in range(len(other.coefficients)):
-            result[i] -= other.coefficients[i]
+        for i in range(len(other._coeffs)):
+            result[i] -= other._coeffs[i]
         
-        return Polynomial(result)
+        return Polynomial(result, self.exact and other.exact)
     
     def __rsub__(self, other: Union['Polynomial', float]) -> 'Polynomial':
         """Right subtraction."""
-        if isinstance(other, (int, float)):
-            other = Polynomial([other])
+        if isinstance(other, _SCALAR_TYPES):
+            other = Polynomial([other], _is_exact_scalar(other))
+        if not isinstance(other, Polynomial):
+            return NotImplemented
         return other.__sub__(self)
     
+    def __iadd__(self, other: Union['Polynomial', float]) -> 'Polynomial':
+        """Add a polynomial or constant in place."""
+        if isinstance(other, _SCALAR_TYPES):
+            coeffs = self._owned_coeffs(self.exact and _is_exact_scalar(other))
+            coeffs[0] += other
+        elif isinstance(other, Polynomial):
+            coeffs = self._owned_coeffs(self.exact and other.exact)
+            theirs = other._coeffs
+            if len(theirs) > len(coeffs):
+                coeffs.extend([0] * (len(theirs) - len(coeffs)))
+            for i, c in enumerate(theirs):
+                coeffs[i] += c
+        else:
+            return NotImplemented
+        
+        self._trim()
+        return self
+    
+    def __isub__(self, other: Union['Polynomial', float]) -> 'Polynomial':
+        """Subtract a polynomial or constant in place."""
+        if isinstance(other, _SCALAR_TYPES):
+            coeffs = self._owned_coeffs(self.exact and _is_exact_scalar(other))
+            coeffs[0] -= other
+        elif isinstance(other, Polynomial):
+            coeffs = self._owned_coeffs(self.exact and other.exact)
+            theirs = other._coeffs
+            if len(theirs) > len(coeffs):
+                coeffs.extend([0] * (len(theirs) - len(coeffs)))
+            for i, c in enumerate(theirs):
+                coeffs[i] -= c
+        else:
+            return NotImplemented
+        
+        self._trim()
+        return self
+    
     def __mul__(self, other: Union['Polynomial', float]) -> 'Polynomial':
         """Multiply two polynomials or multiply a polynomial by a constant."""
-        if isinstance(other, (int, float)):
-            result = [c * other for c in self.coefficients]
-            return Polynomial(result)
+        if isinstance(other, _SCALAR_TYPES):
+            result = [c * other for c in self._coeffs]
+            return Polynomial(result, self.exact and _is_exact_scalar(other))
         
         if not isinstance(other, Polynomial):
-            raise TypeError("Can only multiply Polynomial or number")
-        
-        # Result degree is sum of degrees
-        result_len = len(self.coefficients) + len(other.coefficients) - 1
-        result = [0.0] * result_len
+            return NotImplemented
         
-        for i, a in enumerate(self.coefficients):
-            for j, b in enumerate(other.coefficients):
-                result[i + j] += a * b
-        
-        return Polynomial(result)
+        # Schoolbook, Karatsuba or FFT depending on operand size
+        return Polynomial(_multiply(self._coeffs, other._coeffs), self.exact and other.exact)
     
     def __rmul__(self, other: Union['Polynomial', float]) -> 'Polynomial':
         """Right multiplication."""
         return self.__mul__(other)
     
+    def __imul__(self, other: Union['Polynomial', float]) -> 'Polynomial':
+        """Multiply by a polynomial or constant in place."""
+        if isinstance(other, _SCALAR_TYPES):
+            coeffs = self._owned_coeffs(self.exact and _is_exact_scalar(other))
+            for i in range(len(coeffs)):
+                coeffs[i] *= other
+        elif isinstance(other, Polynomial):
+            exact = self.exact and other.exact
+            self._coeffs = Polynomial(_multiply(self._coeffs, other._coeffs), exact)._coeffs
+        else:
+            return NotImplemented
+        
+        self._trim()
+        return self
+    
     def __truediv__(self, other: Union[float, 'Polynomial']) -> Union['Polynomial', Tuple['Polynomial', 'Polynomial']]:
         """
         Divide polynomial by a scalar or perform polynomial division.
@@ -175,11 +1228,12 @@ class Polynomial:
         For scalar division, returns the polynomial with all coefficients divided.
         For polynomial division, returns (quotient, remainder).
         """
-        if isinstance(other, (int, float)):
-            if abs(other) < 1e-10:
+        if isinstance(other, _SCALAR_TYPES):
+            exact = self.exact and _is_exact_scalar(other)
+            if other == 0 or (not exact and abs(other) < 1e-10):
                 raise ValueError("Division by zero")
-            result = [c / other for c in self.coefficients]
-            return Polynomial(result)
+            result = [c / other for c in self._coeffs]
+            return Polynomial(result, exact)
         
         if not isinstance(other, Polynomial):
             raise TypeError("Can only divide by Polynomial or number")
@@ -192,10 +1246,10 @@ class Polynomial:
             raise ValueError("Power must be a non-negative integer")
         
         if n == 0:
-            return Polynomial([1])
+            return Polynomial([1], self.exact)
         
-        result = Polynomial([1])
-        base = Polynomial(self.coefficients)
+        result = Polynomial([1], self.exact)
+        base = self
         
         # Fast exponentiation
         while n > 0:
@@ -207,14 +1261,22 @@ class Polynomial:
         return result
     
     def __call__(self, x: float) -> float:
-        """Evaluate the polynomial at a given value using Horner's method."""
-        if not self.coefficients:
+        """
+        Evaluate the polynomial at a given value using Horner's method.
+        
+        Lists, tuples, array.array, typed memoryviews and NumPy arrays are
+        evaluated point-wise through evaluate_many(); raw bytes are rejected.
+        """
+        if _is_batch(x):
+            return self.evaluate_many(x)
+        
+        if not self._coeffs:
             return 0.0
         
         # Horner's method: evaluate from highest to lowest degree
-        result = self.coefficients[-1]
-        for i in range(len(self.coefficients) - 2, -1, -1):
-            result = result * x + self.coefficients[i]
+        result = self._coeffs[-1]
+        for i in range(len(self._coeffs) - 2, -1, -1):
+            result = result * x + self._coeffs[i]
         
         return result
     
@@ -223,13 +1285,238 @@ class Polynomial:
         Evaluate the polynomial at a given value.
         
         Args:
-            x: The value at which to evaluate the polynomial
+            x: The value (or container of values) at which to evaluate
             
         Returns:
             The value of the polynomial at x
         """
         return self(x)
     
+    def evaluate_with_error(self, x: float) -> Tuple[float, float]:
+        """
+        Evaluate at x with compensated Horner and a rigorous error bound.
+        
+        The rounding errors of every Horner step are captured exactly
+        (TwoProduct and TwoSum) and accumulated in a second Horner pass, so
+        the result is as accurate as plain Horner in twice the working
+        precision. The bound is Langlois and Louvet's running error bound,
+        computed alongside at no extra pass over the coefficients. It holds
+        unless an intermediate value overflows or underflows.
+        
+        Exact-mode polynomials are evaluated exactly; the bound is then the
+        rounding error of the returned float.
+        
+        Args:
+            x: The point at which to evaluate
+            
+        Returns:
+            (value, bound) with |value - p(x)| <= bound
+        """
+        if self.exact:
+            return self._evaluate_exact(x)
+        
+        coeffs = self._coeffs
+        n = len(coeffs) - 1
+        if n <= 0:
+            return (coeffs[0] if coeffs else 0.0), 0.0
+        
+        x = float(x)
+        abs_x = abs(x)
+        s = coeffs[n]
+        correction = 0.0    # Horner of the error terms at x
+        magnitude = 0.0     # Horner of their absolute values at |x|
+        for i in range(n - 1, -1, -1):
+            p, p_error = _two_product(s, x)
+            s, s_error = _two_sum(p, coeffs[i])
+            correction = correction * x + (p_error + s_error)
+            magnitude = magnitude * abs_x + (abs(p_error) + abs(s_error))
+        
+        value = s + correction
+        u = _UNIT_ROUNDOFF
+        bound = (u * abs(value) + (_gamma(4 * n + 2) * magnitude + 2 * u * u * abs(value))) / (1 - 2 * (n + 1) * u)
+        return value, bound
+    
+    def _evaluate_exact(self, x: float) -> Tuple[float, float]:
+        """Evaluate at x in exact rational arithmetic; return (nearest float, its error)."""
+        x = Fraction(x)
+        total = Fraction(0)
+        for coef in reversed(self._coeffs):
+            total = total * x + Fraction(coef)
+        
+        value = float(total)
+        error = abs(Fraction(value) - total)
+        bound = float(error)
+        if bound < error:
+            bound = math.nextafter(bound, math.inf)
+        return value, bound
+    
+    def evaluate_certified(self, x: float, rtol: float = CERTIFIED_RTOL) -> Tuple[float, float]:
+        """
+        Evaluate at x to a guaranteed relative accuracy.
+        
+        The fast compensated evaluation is accepted whenever its error bound
+        is within rtol of the value, which is almost every point of a
+        reasonably conditioned polynomial. Points where it is not (close to a
+        root, or with heavy cancellation) are re-evaluated exactly, so the
+        sign of the returned value is always correct.
+        
+        Args:
+            x: The point at which to evaluate
+            rtol: Largest accepted bound relative to |value|
+            
+        Returns:
+            (value, bound) with |value - p(x)| <= bound
+        """
+        value, bound = self.evaluate_with_error(x)
+        if bound <= rtol * abs(value) or self.exact:
+            return value, bound
+        return self._evaluate_exact(x)
+    
+    def evaluate_interval(self, x: float, rtol: Union[float, None] = None) -> Tuple[float, float]:
+        """
+        Evaluate at x as an interval guaranteed to contain p(x).
+        
+        Args:
+            x: The point at which to evaluate
+            rtol: If given, tighten wide intervals as in evaluate_certified()
+            
+        Returns:
+            (low, high), rounded outwards
+        """
+        if rtol is None:
+            value, bound = self.evaluate_with_error(x)
+        else:
+            value, bound = self.evaluate_certified(x, rtol)
+        if bound == 0:
+            return value, value
+        return math.nextafter(value - bound, -math.inf), math.nextafter(value + bound, math.inf)
+    
+    def evaluate_many(self, xs: Sequence[float]):
+        """
+        Evaluate the polynomial at many points at once.
+        
+        Horner's method is run across the whole batch: one pass over the
+        points per coefficient instead of one Python call per point.
+        
+        Args:
+            xs: A list, tuple, array.array, typed memoryview or NumPy array of
+                points (raw bytes raise TypeError)
+                
+        Returns:
+            The values in the same container type as xs. array.array input
+            keeps a float typecode ('f' or 'd'), memoryviews return
+            array('d') and any other iterable returns a list. NumPy input
+            gives an object array for exact-mode polynomials.
+        """
+        coeffs = self._coeffs
+        
+        if _np is not None and isinstance(xs, _np.ndarray):
+            # Fraction coefficients cannot be added into a float64 array; exact
+            # polynomials evaluate in an object array (Fractions at integer points)
+            dtype = object if self.exact else _np.result_type(xs, float)
+            result = _np.full(xs.shape, coeffs[-1], dtype=dtype)
+            for coef in reversed(coeffs[:-1]):
+                result *= xs
+                result += coef
+            return result
+        
+        if _is_raw_bytes(xs):
+            raise TypeError("Cannot evaluate at raw bytes; cast the buffer to its element type, "
+                            "e.g. memoryview(data).cast('d')")
+        
+        is_buffer = isinstance(xs, memoryview)
+        if is_buffer:
+            points = memoryview(xs).tolist()
+        elif isinstance(xs, (list, tuple, array)):
+            points = xs
+        else:
+            points = list(xs)
+        
+        # Horner's method, one coefficient at a time over the whole batch
+        values = [coeffs[-1]] * len(points)
+        for coef in reversed(coeffs[:-1]):
+            values = [v * x + coef for v, x in zip(values, points)]
+        
+        if isinstance(xs, tuple):
+            return tuple(values)
+        if isinstance(xs, array):
+            return array(xs.typecode if xs.typecode in 'fd' else 'd', values)
+        if is_buffer:
+            return array('d', values)
+        return values
+    
+    def evaluate_stream(self, xs: Iterable[float], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[float]:
+        """
+        Lazily evaluate the polynomial over a stream of points.
+        
+        Points are read in chunks and each chunk is evaluated by the batch
+        Horner kernel of evaluate_many(), so memory stays bounded by
+        chunk_size however long the stream is. Values for a chunk are
+        yielded once the chunk is full or the stream ends.
+        
+        Args:
+            xs: Any iterable of points, e.g. an unbounded generator
+            chunk_size: Points per batch
+            
+        Returns:
+            Iterator over the values, in stream order
+        """
+        for chunk in _stream_chunks(xs, chunk_size):
+            yield from self.evaluate_many(chunk)
+    
+    def multipoint_evaluate(self, points: Iterable[float]) -> List[float]:
+        """
+        Evaluate the polynomial at many points, returned as a list of floats.
+        
+        A thin wrapper over evaluate_many() for any iterable of points. No
+        subproduct-tree evaluation is used: for real points its product
+        polynomials have coefficients that grow like prod(1 + |x_i|), so it
+        loses all accuracy long before it pays off in pure Python.
+        
+        Args:
+            points: The values at which to evaluate
+            
+        Returns:
+            List of values, one per point
+        """
+        return self.evaluate_many([float(x) for x in points])
+    
+    @classmethod
+    def interpolate(cls, xs: Sequence[float], ys: Sequence[float],
+                    exact: bool = False) -> 'Polynomial':
+        """
+        Build the polynomial of lowest degree through the points (xs[i], ys[i]).
+        
+        Uses Newton's divided differences in O(n^2). Monomial coefficients
+        are ill-conditioned at high degree, so expect accuracy to degrade
+        beyond a few dozen points spread over [-1, 1].
+        
+        Args:
+            xs: Distinct sample positions
+            ys: Sample values
+            exact: Interpolate with Fractions (Newton form) and return an
+                   exact-mode polynomial
+                   
+        Returns:
+            The interpolating Polynomial, of degree at most len(xs) - 1
+        """
+        convert = Fraction if exact else float
+        xs = [convert(x) for x in xs]
+        ys = [convert(y) for y in ys]
+        if len(xs) != len(ys):
+            raise ValueError("xs and ys must have the same length")
+        if not xs:
+            raise ValueError("At least one point is required")
+        
+        if exact:
+            return cls(_interpolate_newton(xs, ys), exact=True)
+        
+        coeffs = _interpolate_newton(xs, ys)
+        if not all(map(math.isfinite, coeffs)):
+            raise ValueError("Interpolation overflowed: the points are too many or too widely spread "
+                             "for monomial coefficients in floating point")
+        return cls(coeffs)
+    
     def derivative(self, n: int = 1) -> 'Polynomial':
         """
         Compute the nth derivative of the polynomial.
@@ -244,20 +1531,20 @@ class Polynomial:
             raise ValueError("Derivative order must be non-negative")
         
         if n == 0:
-            return Polynomial(self.coefficients)
-        
-        if len(self.coefficients) <= n:
-            return Polynomial([0])
+            return self.copy()
         
-        result = list(self.coefficients)
+        if len(self._coeffs) <= n:
+            return Polynomial([0], self.exact)
         
+        return Polynomial._from_array(self._cached(('derivative', n), lambda: self._derivative(n)))
+    
+    def _derivative(self, n: int) -> List[float]:
+        """Compute the coefficients of the nth derivative (n < number of coefficients)."""
+        # Each step reads the previous one directly; no up-front copy
+        result = self._coeffs
         for _ in range(n):
-            if len(result) <= 1:
-                result = [0]
-                break
             result = [result[i] * i for i in range(1, len(result))]
-        
-        return Polynomial(result)
+        return result
     
     def integrate(self, constant: float = 0.0) -> 'Polynomial':
         """
@@ -269,11 +1556,17 @@ class Polynomial:
         Returns:
             The integral as a new Polynomial
         """
-        result = [constant]
-        for i, coef in enumerate(self.coefficients):
-            result.append(coef / (i + 1))
+        antiderivative = self._cached(('integrate',), self._integrate)
+        if constant == 0:
+            return Polynomial._from_array(antiderivative)
         
-        return Polynomial(result)
+        result = list(antiderivative)
+        result[0] = constant
+        return Polynomial(result, self.exact and _is_exact_scalar(constant))
+    
+    def _integrate(self) -> List[float]:
+        """Compute the coefficients of the antiderivative with zero constant."""
+        return [0] + [coef / i for i, coef in enumerate(self._coeffs, 1)]
     
     def definite_integral(self, a: float, b: float) -> float:
         """
@@ -286,13 +1579,17 @@ class Polynomial:
         Returns:
             The value of the definite integral
         """
-        antiderivative = self.integrate()
+        antiderivative = Polynomial._from_array(self._cached(('integrate',), self._integrate))
         return antiderivative(b) - antiderivative(a)
     
     def divmod(self, other: 'Polynomial') -> Tuple['Polynomial', 'Polynomial']:
         """
         Perform polynomial division, returning quotient and remainder.
         
+        Above FAST_DIVISION_THRESHOLD the quotient is computed from a Newton
+        reciprocal of the reversed divisor, which is cached on the divisor
+        and reused by later divisions by the same polynomial.
+        
         Args:
             other: The divisor polynomial
             
@@ -302,37 +1599,25 @@ class Polynomial:
         if not isinstance(other, Polynomial):
             raise TypeError("Divisor must be a Polynomial")
         
-        if all(abs(c) < 1e-10 for c in other.coefficients):
+        if all(c == 0 if other.exact else abs(c) < 1e-10 for c in other._coeffs):
             raise ValueError("Division by zero polynomial")
         
-        # Make copies
-        dividend = list(self.coefficients)
-        divisor = list(other.coefficients)
-        
-        # Normalize divisor
-        while len(divisor) > 1 and abs(divisor[-1]) < 1e-10:
-            divisor.pop()
-        
-        if len(dividend) < len(divisor):
-            return Polynomial([0]), Polynomial(dividend)
-        
-        quotient = []
-        
-        while len(dividend) >= len(divisor):
-            # Divide leading terms
-            coef = dividend[-1] / divisor[-1]
-            quotient.append(coef)
-            
-            # Subtract divisor * coef from dividend
-            for i in range(len(divisor)):
-                dividend[len(dividend) - len(divisor) + i] -= coef * divisor[i]
-            
-            # Remove leading term
-            dividend.pop()
-        
-        quotient.reverse()
-        
-        return Polynomial(quotient if quotient else [0]), Polynomial(dividend if dividend else [0])
+        exact = self.exact and other.exact
+        if _use_fast_division(len(self._coeffs), len(other._coeffs)):
+            quotient, remainder = other._divisor()._divmod_coefficients(self._coeffs)
+        else:
+            quotient, remainder = _divmod_schoolbook(self._coeffs, other._coeffs)
+        return (Polynomial(quotient if quotient else [0], exact),
+                Polynomial(remainder if remainder else [0], exact))
+    
+    def _divisor(self) -> 'PolynomialDivisor':
+        """Return this polynomial's PolynomialDivisor, cached until it is mutated."""
+        if self._cache is None:
+            self._cache = {}
+        divisor = self._cache.get(('divisor',))
+        if divisor is None:
+            divisor = self._cache[('divisor',)] = PolynomialDivisor(self)
+        return divisor
     
     def compose(self, other: 'Polynomial') -> 'Polynomial':
         """
@@ -347,37 +1632,131 @@ class Polynomial:
         if not isinstance(other, Polynomial):
             raise TypeError("Can only compose with another Polynomial")
         
-        result = Polynomial([0])
-        power = Polynomial([1])  # other^0
+        inner = other._coeffs
+        exact = self.exact and other.exact
         
-        for coef in self.coefficients:
-            result = result + power * coef
-            power = power * other
+        if len(inner) == 1:
+            return Polynomial([self(inner[0])], exact)
         
-        return result
+        # Affine inner polynomial: Taylor shift p(a*x + b)
+        if len(inner) == 2 and len(self._coeffs) <= TAYLOR_SHIFT_THRESHOLD:
+            return Polynomial(_compose_affine(self._coeffs, inner[1], inner[0]), exact)
+        
+        return Polynomial(_compose_divide_conquer(self._coeffs, inner), exact)
     
     def gcd(self, other: 'Polynomial') -> 'Polynomial':
         """
         Compute the greatest common divisor using Euclidean algorithm.
         
+        If both polynomials are exact, the GCD is computed exactly with the
+        subresultant algorithm on integer coefficients instead.
+        
         Args:
             other: The other polynomial
             
         Returns:
             The GCD polynomial (monic)
         """
-        a = Polynomial(self.coefficients)
-        b = Polynomial(other.coefficients)
+        if self.exact and other.exact:
+            return self._gcd_exact(other)
+        
+        a = self
+        b = other
         
-        while not all(abs(c) < 1e-10 for c in b.coefficients):
+        while not all(abs(c) < 1e-10 for c in b._coeffs):
             _, remainder = a.divmod(b)
             a = b
             b = remainder
         
         # Make monic (leading coefficient = 1)
-        if abs(a.coefficients[-1]) > 1e-10:
-            return a / a.coefficients[-1]
-        return a
+        if abs(a._coeffs[-1]) > 1e-10:
+            return a / a._coeffs[-1]
+        return Polynomial(a._coeffs)
+    
+    def _gcd_exact(self, other: 'Polynomial') -> 'Polynomial':
+        """Monic GCD of two exact polynomials via the subresultant PRS."""
+        if other._coeffs[-1] == 0:
+            if self._coeffs[-1] == 0:
+                return Polynomial([0], exact=True)
+            return self / self._coeffs[-1]
+        if self._coeffs[-1] == 0:
+            return other / other._coeffs[-1]
+        
+        gcd = _gcd_subresultant(_primitive_integer(self._coeffs), _primitive_integer(other._coeffs))
+        lead = gcd[-1]
+        return Polynomial([Fraction(c, lead) for c in gcd], exact=True)
+    
+    def roots(self, tol: float = 1e-12, max_iter: int = 500) -> List[complex]:
+        """
+        Find all complex roots numerically (any degree).
+        
+        Uses the Aberth-Ehrlich simultaneous iteration. Roots are returned
+        even if max_iter is reached before every root meets tol.
+        
+        Args:
+            tol: Relative size of the last correction at which a root is accepted
+            max_iter: Maximum number of sweeps over all roots
+            
+        Returns:
+            List of degree roots (with multiplicity), sorted by real then imaginary part
+        """
+        return Polynomial.roots_batch([self], tol, max_iter)[0]
+    
+    def real_roots(self, tol: float = 1e-12, max_iter: int = 500,
+                   imag_tol: float = 1e-8) -> List[float]:
+        """
+        Find the real roots numerically.
+        
+        Args:
+            tol: Passed to roots()
+            max_iter: Passed to roots()
+            imag_tol: Largest imaginary part (relative to the root size)
+                      for a root to be counted as real
+                      
+        Returns:
+            Sorted list of real roots (with multiplicity)
+        """
+        return [z.real for z in self.roots(tol, max_iter)
+                if abs(z.imag) <= imag_tol * max(1.0, abs(z))]
+    
+    @staticmethod
+    def roots_batch(polynomials: Sequence['Polynomial'], tol: float = 1e-12,
+                    max_iter: int = 500) -> List[List[complex]]:
+        """
+        Find the roots of many polynomials at once.
+        
+        Polynomials of the same degree are solved together; when NumPy is
+        installed each such group is iterated as one vectorized batch.
+        
+        Args:
+            polynomials: The polynomials to solve
+            tol: Relative size of the last correction at which a root is accepted
+            max_iter: Maximum number of iterations
+            
+        Returns:
+            One sorted list of roots per polynomial, in input order
+        """
+        results: List[List[complex]] = [[] for _ in polynomials]
+        groups = {}
+        
+        for index, poly in enumerate(polynomials):
+            zeros, monic = _root_setup(poly._coeffs)
+            results[index] = [0j] * zeros
+            if len(monic) > 1:
+                groups.setdefault(len(monic), []).append((index, monic))
+        
+        for members in groups.values():
+            monics = [monic for _, monic in members]
+            if _np is not None and len(members) > 1:
+                found = _aberth_batch_numpy(monics, tol, max_iter)
+            else:
+                found = [_aberth(monic, tol, max_iter) for monic in monics]
+            for (index, _), roots in zip(members, found):
+                results[index].extend(complex(z) for z in roots)
+        
+        for roots in results:
+            roots.sort(key=lambda z: (z.real, z.imag))
+        return results
     
     def roots_linear_quadratic(self) -> List[complex]:
         """
@@ -387,7 +1766,7 @@ class Polynomial:
             List of roots (may be complex)
         """
         # Remove leading zeros
-        coeffs = self.coefficients.copy()
+        coeffs = list(self._coeffs)
         while len(coeffs) > 1 and abs(coeffs[-1]) < 1e-10:
             coeffs.pop()
         
@@ -411,7 +1790,7 @@ class Polynomial:
                 ]
             else:
                 sqrt_disc = math.sqrt(-discriminant)
-                real_part = -b / (2 * a)
+                real_part = -b / (2 * a) if b else 0.0
                 imag_part = sqrt_disc / (2 * a)
                 return [
                     complex(real_part, imag_part),
@@ -419,3 +1798,152 @@ class Polynomial:
                 ]
         else:
             raise ValueError("Analytical root finding only supported for degree <= 2")
+
+
+def evaluate_stream(polynomials: Sequence[Polynomial], xs: Iterable[float],
+                    chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Tuple[float, ...]]:
+    """
+    Evaluate several polynomials over one stream of points in a single pass.
+    
+    Each chunk of points is read once and evaluated by every polynomial with
+    the batch Horner kernel; memory stays bounded by chunk_size.
+    
+    Args:
+        polynomials: The polynomials to evaluate, e.g. [p, p.derivative(), p.integrate()]
+        xs: Any iterable of points, e.g. an unbounded generator
+        chunk_size: Points per batch
+        
+    Returns:
+        Iterator over tuples holding one value per polynomial, in stream order
+        
+    Example:
+        >>> p = Polynomial([1, 0, 1])
+        >>> list(evaluate_stream([p, p.derivative()], iter([0.0, 2.0])))
+        [(1.0, 0.0), (5.0, 4.0)]
+    """
+    polynomials = list(polynomials)
+    for chunk in _stream_chunks(xs, chunk_size):
+        yield from zip(*[p.evaluate_many(chunk) for p in polynomials])
+
+
+class PolynomialAccumulator:
+    """
+    Mutable running sum of scaled polynomials.
+    
+    Terms are added straight into one coefficient buffer, so summing many
+    polynomials creates no intermediate Polynomial objects.
+    """
+    
+    __slots__ = ('_coeffs',)
+    
+    def __init__(self, size_hint: int = 1):
+        """
+        Initialize an empty (zero) accumulator.
+        
+        Args:
+            size_hint: Expected number of coefficients of the final sum
+        """
+        self._coeffs = array('d', [0.0]) * max(1, size_hint)
+    
+    def add(self, term: Union[Polynomial, float], scale: float = 1.0) -> 'PolynomialAccumulator':
+        """
+        Add scale * term to the running sum.
+        
+        Args:
+            term: A Polynomial or constant
+            scale: Factor applied to term before adding (default: 1)
+            
+        Returns:
+            The accumulator itself, so calls can be chained
+        """
+        coeffs = self._coeffs
+        
+        if isinstance(term, _SCALAR_TYPES):
+            coeffs[0] += scale * term
+            return self
+        
+        if not isinstance(term, Polynomial):
+            raise TypeError("Can only accumulate Polynomial or number")
+        
+        theirs = term._coeffs
+        if len(theirs) > len(coeffs):
+            coeffs.extend(array('d', [0.0]) * (len(theirs) - len(coeffs)))
+        if scale == 1.0:
+            for i, c in enumerate(theirs):
+                coeffs[i] += c
+        else:
+            for i, c in enumerate(theirs):
+                coeffs[i] += scale * c
+        return self
+    
+    def clear(self) -> None:
+        """Reset the running sum to zero, keeping the allocated buffer."""
+        coeffs = self._coeffs
+        for i in range(len(coeffs)):
+            coeffs[i] = 0.0
+    
+    def to_polynomial(self) -> Polynomial:
+        """Return the current sum as a new Polynomial."""
+        return Polynomial(self._coeffs)
+
+
+class PolynomialDivisor:
+    """
+    A fixed divisor prepared for fast repeated division.
+    
+    The reciprocal of the reversed divisor is computed once by Newton
+    iteration and extended only when a longer dividend needs more terms, so
+    reducing many polynomials modulo the same one costs two multiplications
+    each.
+    """
+    
+    def __init__(self, divisor: Polynomial):
+        """
+        Prepare a divisor.
+        
+        Args:
+            divisor: The (nonzero) polynomial to divide by
+        """
+        if not isinstance(divisor, Polynomial):
+            raise TypeError("Divisor must be a Polynomial")
+        if all(c == 0 if divisor.exact else abs(c) < 1e-10 for c in divisor._coeffs):
+            raise ValueError("Division by zero polynomial")
+        
+        self.divisor = divisor.copy()
+        self._coeffs = list(self.divisor._coeffs)
+        self._reversed = self._coeffs[::-1]
+        self._reciprocal: List[float] = []
+    
+    def _reciprocal_terms(self, length: int) -> List[float]:
+        """Return at least length terms of 1 / rev(divisor), extending the cache."""
+        if len(self._reciprocal) < length:
+            self._reciprocal = _series_reciprocal(self._reversed, length, self._reciprocal)
+        return self._reciprocal
+    
+    def _divmod_coefficients(self, dividend: Sequence[float]) -> Tuple[List[float], List[float]]:
+        """Divide raw coefficients, picking long or Newton division by size."""
+        if not _use_fast_division(len(dividend), len(self._coeffs)):
+            return _divmod_schoolbook(dividend, self._coeffs)
+        k = len(dividend) - len(self._coeffs) + 1
+        return _divmod_newton(dividend, self._coeffs, self._reciprocal_terms(k))
+    
+    def divmod(self, dividend: Polynomial) -> Tuple[Polynomial, Polynomial]:
+        """
+        Divide a polynomial by the prepared divisor.
+        
+        Args:
+            dividend: The polynomial to divide
+            
+        Returns:
+            Tuple of (quotient, remainder)
+        """
+        if not isinstance(dividend, Polynomial):
+            raise TypeError("Dividend must be a Polynomial")
+        exact = dividend.exact and self.divisor.exact
+        quotient, remainder = self._divmod_coefficients(dividend._coeffs)
+        return (Polynomial(quotient if quotient else [0], exact),
+                Polynomial(remainder if remainder else [0], exact))
+    
+    def mod(self, dividend: Polynomial) -> Polynomial:
+        """Return the remainder of dividend modulo the prepared divisor."""
+        return self.divmod(dividend)[1]
@@ -0,0 +1,350 @@
+"""
+Benchmarks for the Polynomial Math Library.
+
+Running the module times the core operations across degrees and records
+their peak memory:
+
+    python polynomial_benchmark.py --json results.json
+    python polynomial_benchmark.py --baseline results.json --threshold 1.25
+    
+With --baseline the run is compared against a saved JSON file and the
+exit status is 1 if any operation got slower than the threshold allows.
+--report runs one of the focused comparison reports instead.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from polynomial import Polynomial, PolynomialAccumulator
+
+
+class ListPolynomial:
+    """Reference layout: a list of boxed floats held in the instance __dict__."""
+    
+    def __init__(self, coefficients):
+        self.coefficients = list(coefficients)
+
+
+def compose_power_sum(outer: Polynomial, inner: Polynomial) -> Polynomial:
+    """Reference composition: sum of coef * inner^k with a running power."""
+    result = PolynomialAccumulator()
+    power = Polynomial([1])
+    for coef in outer.coefficients:
+        result.add(power, coef)
+        power = power * inner
+    return result.to_polynomial()
+
+
+def best_time(func, *args, repeat: int = 3) -> float:
+    """Return the fastest of several wall-clock timings of func(*args)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def random_polynomial(degree: int, rng: random.Random) -> Polynomial:
+    """Return a polynomial of exactly the given degree with coefficients in [-1, 1]."""
+    coeffs = [rng.uniform(-1, 1) for _ in range(degree)]
+    return Polynomial(coeffs + [rng.choice([-1.0, 1.0])])
+
+
+def monic_divisor(degree: int, rng: random.Random) -> Polynomial:
+    """Return a well-conditioned monic divisor (small lower coefficients)."""
+    coeffs = [rng.uniform(-1, 1) / (degree + 1) for _ in range(degree)]
+    return Polynomial(coeffs + [1.0])
+
+
+# Each operation maps to (setup, max_degree). setup(degree, rng) builds fresh
+# inputs outside the timer and returns the zero-argument call to measure;
+# degrees above max_degree are skipped because the operation is superlinear.
+OPERATIONS = {
+    'add': (lambda d, rng: random_polynomial(d, rng).__add__, 10 ** 5),
+    'mul': (lambda d, rng: random_polynomial(d, rng).__mul__, 10 ** 5),
+    'pow': (lambda d, rng: random_polynomial(d, rng).__pow__, 10 ** 4),
+    'call': (lambda d, rng: random_polynomial(d, rng).__call__, 10 ** 5),
+    'derivative': (lambda d, rng: random_polynomial(d, rng).derivative, 10 ** 5),
+    'integrate': (lambda d, rng: random_polynomial(d, rng).integrate, 10 ** 5),
+    'divmod': (lambda d, rng: random_polynomial(d, rng).divmod, 10 ** 5),
+    'compose': (lambda d, rng: random_polynomial(d, rng).compose, 10 ** 4),
+    'gcd': (lambda d, rng: random_polynomial(d, rng).gcd, 10 ** 3),
+}
+
+# Second argument for each operation
+OPERANDS = {
+    'add': lambda d, rng: random_polynomial(d, rng),
+    'mul': lambda d, rng: random_polynomial(d, rng),
+    'pow': lambda d, rng: 3,
+    'call': lambda d, rng: rng.uniform(-1, 1),
+    'derivative': None,
+    'integrate': None,
+    'divmod': lambda d, rng: monic_divisor(max(d // 2, 0), rng),
+    'compose': lambda d, rng: Polynomial([0.01, 0, 1]),
+    'gcd': lambda d, rng: random_polynomial(max(d - 1, 0), rng),
+}
+
+DEFAULT_DEGREES = (1, 10, 100, 1000, 10 ** 4, 10 ** 5)
+
+
+def prepare(operation: str, degree: int, rng: random.Random):
+    """Return a fresh zero-argument callable running operation at degree."""
+    setup, _ = OPERATIONS[operation]
+    method = setup(degree, rng)
+    operand = OPERANDS[operation]
+    if operand is None:
+        return method
+    argument = operand(degree, rng)
+    return lambda: method(argument)
+
+
+def measure(operation: str, degree: int, repeat: int, seed: int = 0) -> dict:
+    """
+    Time one operation and record its peak memory.
+    
+    Inputs are rebuilt before every repetition so per-instance caches never
+    turn a measurement into a cache hit.
+    
+    Returns:
+        Result record with the best time in seconds and the peak number of
+        bytes allocated while the operation ran
+    """
+    rng = random.Random(seed)
+    timings = []
+    for _ in range(repeat):
+        call = prepare(operation, degree, rng)
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    
+    call = prepare(operation, degree, rng)
+    tracemalloc.start()
+    call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    return {
+        'operation': operation,
+        'degree': degree,
+        'seconds': min(timings),
+        'peak_bytes': peak,
+    }
+
+
+def run_suite(operations, degrees, repeat: int) -> dict:
+    """Measure every operation at every supported degree and print a table."""
+    print(f"{'operation':>11} {'degree':>8} {'seconds':>12} {'peak KiB':>11}")
+    print("-" * 60)
+    
+    results = []
+    for operation in operations:
+        max_degree = OPERATIONS[operation][1]
+        for degree in degrees:
+            if degree > max_degree:
+                continue
+            record = measure(operation, degree, repeat)
+            results.append(record)
+            print(f"{operation:>11} {degree:>8} {record['seconds']:>12.6f} "
+                  f"{record['peak_bytes'] / 1024:>11.1f}", flush=True)
+    
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float,
+            min_seconds: float = 1e-4) -> list:
+    """
+    Compare a run against a baseline run.
+    
+    Args:
+        current: Output of run_suite
+        baseline: Earlier output of run_suite (e.g. loaded from JSON)
+        threshold: Slowdown ratio above which a result counts as a regression
+        min_seconds: Baseline timings below this are too noisy to compare
+        
+    Returns:
+        List of (operation, degree, baseline seconds, current seconds, ratio)
+        for every regression
+    """
+    previous = {(r['operation'], r['degree']): r for r in baseline['results']}
+    regressions = []
+    
+    print(f"{'operation':>11} {'degree':>8} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    print("-" * 60)
+    for record in current['results']:
+        old = previous.get((record['operation'], record['degree']))
+        if old is None:
+            continue
+        ratio = record['seconds'] / old['seconds'] if old['seconds'] else float('inf')
+        flag = ""
+        if old['seconds'] >= min_seconds and ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append((record['operation'], record['degree'],
+                                old['seconds'], record['seconds'], ratio))
+        print(f"{record['operation']:>11} {record['degree']:>8} {old['seconds']:>12.6f} "
+              f"{record['seconds']:>12.6f} {ratio:>6.2f}x{flag}")
+    
+    return regressions
+
+
+def memory_per_instance(cls, degree: int, count: int = 10000) -> float:
+    """
+    Measure the average memory held by one live instance of cls.
+    
+    Args:
+        cls: Polynomial class (or layout) to construct
+        degree: Degree of every polynomial created
+        count: Number of instances kept alive during the measurement
+        
+    Returns:
+        Bytes per instance, including its coefficient storage
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls([i + j * 0.5 for j in range(degree + 1)]) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(instances)) / len(instances)
+
+
+def run_memory_benchmark():
+    print("=" * 60)
+    print("MEMORY PER INSTANCE (bytes)")
+    print("=" * 60)
+    print(f"{'degree':>8} {'list layout':>14} {'Polynomial':>14} {'saved':>10}")
+    print("-" * 60)
+    
+    for degree in (0, 2, 5, 10, 50, 200):
+        legacy = memory_per_instance(ListPolynomial, degree)
+        current = memory_per_instance(Polynomial, degree)
+        saved = 100.0 * (legacy - current) / legacy
+        print(f"{degree:>8} {legacy:>14.1f} {current:>14.1f} {saved:>9.1f}%")
+    
+    print("=" * 60)
+
+
+def run_compose_benchmark():
+    print("=" * 60)
+    print("COMPOSITION f(g(x)) (seconds)")
+    print("=" * 60)
+    print(f"{'degree':>8} {'inner':>10} {'power sum':>12} {'compose':>12} {'speedup':>9}")
+    print("-" * 60)
+    
+    rng = random.Random(0)
+    # Inner polynomials with leading coefficient 1 and small lower terms keep
+    # the coefficients of high-degree compositions within float range.
+    inners = {
+        "affine": Polynomial([0.01, 1]),
+        "quadratic": Polynomial([0.01, 0, 1]),
+        "quartic": Polynomial([0.01, 0.01, 0, 0, 1]),
+    }
+    
+    for degree in (10, 50, 100, 500, 1000, 2000):
+        outer = Polynomial([rng.uniform(-1, 1) for _ in range(degree + 1)])
+        for name, inner in inners.items():
+            reference = best_time(compose_power_sum, outer, inner, repeat=1)
+            current = best_time(outer.compose, inner)
+            print(f"{degree:>8} {name:>10} {reference:>12.4f} {current:>12.4f} "
+                  f"{reference / current:>8.1f}x")
+    
+    print("=" * 60)
+
+
+def run_gcd_benchmark():
+    print("=" * 60)
+    print("GCD: FLOAT EUCLID vs EXACT SUBRESULTANT")
+    print("=" * 60)
+    print(f"{'degree':>8} {'float (s)':>11} {'float deg':>10} {'exact (s)':>11} {'exact deg':>10}")
+    print("-" * 60)
+    
+    rng = random.Random(0)
+    
+    def random_integer_poly(degree):
+        coeffs = [rng.randint(-9, 9) for _ in range(degree)]
+        return coeffs + [rng.choice([-1, 1]) * rng.randint(1, 9)]
+    
+    for degree in (4, 8, 16, 32, 64):
+        # a = f*g and b = f*h share the factor f of degree `degree`
+        f = Polynomial(random_integer_poly(degree), exact=True)
+        a = f * Polynomial(random_integer_poly(degree), exact=True)
+        b = f * Polynomial(random_integer_poly(degree), exact=True)
+        a_float = Polynomial(a.coefficients)
+        b_float = Polynomial(b.coefficients)
+        
+        float_time = best_time(a_float.gcd, b_float)
+        exact_time = best_time(a.gcd, b)
+        print(f"{degree:>8} {float_time:>11.5f} {a_float.gcd(b_float).degree:>10} "
+              f"{exact_time:>11.5f} {a.gcd(b).degree:>10}")
+    
+    print("=" * 60)
+    print("The common factor has the listed degree; a float GCD of any other")
+    print("degree is wrong.")
+
+
+REPORTS = {
+    'memory': run_memory_benchmark,
+    'compose': run_compose_benchmark,
+    'gcd': run_gcd_benchmark,
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Polynomial Math Library.")
+    parser.add_argument('--operations', nargs='+', choices=sorted(OPERATIONS),
+                        default=list(OPERATIONS), help="operations to measure")
+    parser.add_argument('--degrees', nargs='+', type=int, default=list(DEFAULT_DEGREES),
+                        help="polynomial degrees to measure")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="timed repetitions per case (the best is kept)")
+    parser.add_argument('--json', metavar='PATH', help="write results as JSON")
+    parser.add_argument('--baseline', metavar='PATH',
+                        help="compare against a JSON file from an earlier run")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="slowdown ratio that counts as a regression")
+    parser.add_argument('--report', choices=sorted(REPORTS),
+                        help="run a focused comparison report instead of the suite")
+    args = parser.parse_args(argv)
+    
+    if args.report:
+        REPORTS[args.report]()
+        return 0
+    
+    print("=" * 60)
+    print("POLYNOMIAL BENCHMARK SUITE")
+    print("=" * 60)
+    current = run_suite(args.operations, args.degrees, args.repeat)
+    
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(current, file, indent=2)
+        print(f"\nResults written to {args.json}")
+    
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        print()
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.2f}x")
+            return 1
+        print("\nNo regressions")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
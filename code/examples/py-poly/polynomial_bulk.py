@@ -0,0 +1,170 @@
+"""
+Bulk Polynomial Operations
+
+Applies one operation to a large collection of polynomials across a process
+pool. Polynomials are sent to the workers in chunks, each packed as one
+buffer of doubles plus offsets instead of one pickled object per polynomial,
+and results stream back in input order. Small inputs run in the calling
+process.
+"""
+
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple, Union
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+import os
+import pickle
+
+from polynomial import Polynomial, _stream_chunks
+
+
+# Inputs with fewer polynomials than this run in the calling process; below it
+# starting workers and pickling costs more than the work itself.
+BULK_PARALLEL_THRESHOLD = 2048
+
+# Polynomials per task sent to a worker.
+BULK_CHUNK_SIZE = 256
+
+
+def _check_operation(operation: Union[str, Callable]) -> None:
+    """
+    Raise TypeError unless operation can be sent to worker processes.
+    
+    Checked for every input, so a lambda or local function fails the same
+    way whether or not the input is large enough to use the pool.
+    """
+    if isinstance(operation, str):
+        return
+    if not callable(operation):
+        raise TypeError("operation must be a Polynomial method name or a callable")
+    try:
+        pickle.dumps(operation)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise TypeError("operation must be a method name or a module-level function "
+                        f"that can be pickled for the worker processes: {e}") from None
+
+
+def _apply(operation: Union[str, Callable], poly: Polynomial, args: Tuple):
+    """Apply a method name or a callable to one polynomial."""
+    if isinstance(operation, str):
+        return getattr(poly, operation)(*args)
+    return operation(poly, *args)
+
+
+def _pack(polys: Sequence[Polynomial]) -> Union[Tuple[bytes, bytes], None]:
+    """
+    Pack float polynomials into one coefficient buffer and an offset buffer.
+    
+    Returns:
+        (coefficients, offsets) as bytes, or None if any item is not a float
+        Polynomial (those chunks are pickled item by item)
+    """
+    coeffs = array('d')
+    offsets = array('q', [0])
+    for p in polys:
+        if not isinstance(p, Polynomial) or p.exact:
+            return None
+        coeffs.extend(p._coeffs)
+        offsets.append(len(coeffs))
+    return coeffs.tobytes(), offsets.tobytes()
+
+
+def _unpack(packed: Tuple[bytes, bytes]) -> List[Polynomial]:
+    """Rebuild the polynomials from the output of _pack."""
+    coeffs = array('d')
+    coeffs.frombytes(packed[0])
+    offsets = array('q')
+    offsets.frombytes(packed[1])
+    return [Polynomial._from_array(coeffs[offsets[i]:offsets[i + 1]])
+            for i in range(len(offsets) - 1)]
+
+
+def _encode(items: List) -> Tuple[str, object]:
+    """
+    Encode a chunk of inputs or results for transfer between processes.
+    
+    Float polynomials become one buffer of coefficients plus offsets, floats
+    one buffer of doubles; anything else is pickled item by item.
+    """
+    packed = _pack(items)
+    if packed is not None:
+        return 'polynomials', packed
+    if all(type(x) is float for x in items):
+        return 'floats', array('d', items).tobytes()
+    return 'objects', items
+
+
+def _decode(encoded: Tuple[str, object]) -> List:
+    """Decode the output of _encode."""
+    kind, payload = encoded
+    if kind == 'polynomials':
+        return _unpack(payload)
+    if kind == 'floats':
+        values = array('d')
+        values.frombytes(payload)
+        return values.tolist()
+    return payload
+
+
+def _run_chunk(operation: Union[str, Callable], args: Tuple, encoded: Tuple[str, object]) -> Tuple[str, object]:
+    """Worker entry point: decode a chunk, apply the operation, encode the results."""
+    return _encode([_apply(operation, p, args) for p in _decode(encoded)])
+
+
+def bulk_map(operation: Union[str, Callable], polynomials: Iterable[Polynomial], *args,
+             workers: Union[int, None] = None, chunk_size: int = BULK_CHUNK_SIZE,
+             min_parallel: int = BULK_PARALLEL_THRESHOLD) -> Iterator:
+    """
+    Apply an operation to every polynomial, in parallel for large inputs.
+    
+    Results are yielded in input order as their chunks complete. Only a
+    bounded number of chunks (twice the number of workers) is in flight at
+    any time, so the input may be a generator of any length.
+    
+    Args:
+        operation: Name of a Polynomial method ('evaluate', 'derivative',
+                   'roots', 'divmod', ...) or a module-level function taking a
+                   polynomial first; lambdas and local functions raise
+                   TypeError even for inputs that run in this process
+        polynomials: The polynomials to process
+        *args: Extra arguments passed to every call, e.g. the point for
+               'evaluate' or the divisor for 'divmod'
+        workers: Number of processes (default: os.cpu_count())
+        chunk_size: Polynomials per task
+        min_parallel: Inputs with fewer polynomials run in this process
+        
+    Returns:
+        Iterator over the results
+        
+    Example:
+        >>> list(bulk_map('evaluate', [Polynomial([1, 2]), Polynomial([0, 0, 1])], 3.0))
+        [7.0, 9.0]
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    _check_operation(operation)
+    
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(polynomials)
+    head = list(islice(iterator, min_parallel))
+    if workers == 1 or len(head) < min_parallel:
+        return (_apply(operation, p, args) for p in chain(head, iterator))
+    
+    return _bulk_parallel(operation, args, chain(head, iterator), workers, chunk_size)
+
+
+def _bulk_parallel(operation: Union[str, Callable], args: Tuple, polynomials: Iterable[Polynomial],
+                   workers: int, chunk_size: int) -> Iterator:
+    """Run bulk_map over a process pool with a bounded window of pending chunks."""
+    chunks = _stream_chunks(polynomials, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in islice(chunks, 2 * workers):
+            pending.append(executor.submit(_run_chunk, operation, args, _encode(chunk)))
+        
+        while pending:
+            results = _decode(pending.popleft().result())
+            for chunk in islice(chunks, 1):
+                pending.append(executor.submit(_run_chunk, operation, args, _encode(chunk)))
+            yield from results
@@ -0,0 +1,309 @@
+"""
+Polynomial Matrix
+
+PolynomialMatrix holds N polynomials as the rows of one contiguous, row-major
+array('d') of N x width coefficients (width = largest degree + 1, shorter
+polynomials padded with zeros). Every operation runs over whole columns at
+once: a column is a strided slice of the buffer and is combined with
+map()/operator kernels, so the interpreter overhead is per coefficient
+position, not per polynomial.
+"""
+
+from typing import Iterator, List, Sequence, Union
+from array import array
+from itertools import repeat
+from operator import add, mul, sub, truediv
+
+from polynomial import Polynomial, _SCALAR_TYPES
+
+
+class PolynomialMatrix:
+    """
+    A batch of float polynomials stored in one 2-D coefficient buffer.
+    
+    Arithmetic combines two matrices with the same number of rows row by
+    row; a Polynomial or a number is applied to every row.
+    
+    Example:
+        >>> batch = PolynomialMatrix([Polynomial([1, 2]), Polynomial([0, 1, 1])])
+        >>> list((batch * batch).evaluate(2.0))
+        [25.0, 36.0]
+    """
+    
+    __slots__ = ('_data', '_rows', '_width')
+    
+    def __init__(self, polynomials: Sequence[Union[Polynomial, Sequence[float]]]):
+        """
+        Initialize a matrix from polynomials or coefficient lists.
+        
+        Args:
+            polynomials: One Polynomial (or list of coefficients in ascending
+                         order of powers) per row
+        """
+        rows = [p._coeffs if isinstance(p, Polynomial) else array('d', p) for p in polynomials]
+        width = max((len(r) for r in rows), default=1) or 1
+        
+        data = array('d')
+        padding = array('d', bytes(8 * width))
+        for r in rows:
+            data.extend(r)
+            data.extend(padding[:width - len(r)])
+        
+        self._data = data
+        self._rows = len(rows)
+        self._width = width
+        self._trim_width()
+    
+    @classmethod
+    def _from_flat(cls, data: array, rows: int, width: int) -> 'PolynomialMatrix':
+        """Wrap a row-major buffer of rows x width doubles without copying it."""
+        matrix = cls.__new__(cls)
+        matrix._data = data
+        matrix._rows = rows
+        matrix._width = width
+        matrix._trim_width()
+        return matrix
+    
+    @classmethod
+    def from_polynomials(cls, polynomials: Sequence[Polynomial]) -> 'PolynomialMatrix':
+        """Create a matrix with one row per polynomial."""
+        return cls(polynomials)
+    
+    def to_polynomials(self) -> List[Polynomial]:
+        """Return the rows as a list of independent Polynomial objects."""
+        return [self[i] for i in range(self._rows)]
+    
+    def _trim_width(self) -> None:
+        """Drop trailing columns that are (near) zero in every row."""
+        width = self._width
+        while width > 1 and max(map(abs, self._column(width - 1)), default=0.0) < 1e-10:
+            width -= 1
+        if width < self._width:
+            data = array('d')
+            for i in range(self._rows):
+                start = i * self._width
+                data.extend(self._data[start:start + width])
+            self._data = data
+            self._width = width
+    
+    def _column(self, j: int) -> array:
+        """Return column j (the coefficients of x^j in every row) as a new array."""
+        if j >= self._width:
+            return array('d', bytes(8 * self._rows))
+        return self._data[j::self._width]
+    
+    def _widened(self, width: int) -> array:
+        """Return the buffer padded with zero columns up to width."""
+        if width == self._width:
+            return self._data
+        result = array('d', bytes(8 * self._rows * width))
+        for j in range(self._width):
+            result[j::width] = self._column(j)
+        return result
+    
+    @property
+    def shape(self) -> tuple:
+        """Return (number of polynomials, number of coefficients per row)."""
+        return self._rows, self._width
+    
+    @property
+    def degree(self) -> int:
+        """Return the largest degree of any row."""
+        return self._width - 1
+    
+    def buffer(self) -> memoryview:
+        """
+        Return the coefficients as a 2-D (rows, width) memoryview.
+        
+        The view shares memory with the matrix, e.g. numpy.asarray(m.buffer())
+        gives a rows x width float64 array without copying. A matrix with no
+        rows returns an empty 1-D 'd' view, since memoryview shapes cannot
+        contain zero.
+        """
+        if self._rows == 0:
+            return memoryview(self._data)
+        return memoryview(self._data).cast('B').cast('d', [self._rows, self._width])
+    
+    def __len__(self) -> int:
+        """Return the number of polynomials."""
+        return self._rows
+    
+    def __getitem__(self, index: int) -> Polynomial:
+        """Return row index as a new Polynomial."""
+        if index < 0:
+            index += self._rows
+        if not 0 <= index < self._rows:
+            raise IndexError("PolynomialMatrix index out of range")
+        start = index * self._width
+        row = self._data[start:start + self._width]
+        del row[Polynomial._trimmed_length(row):]
+        return Polynomial._from_array(row)
+    
+    def __iter__(self) -> Iterator[Polynomial]:
+        """Iterate over the rows as Polynomial objects."""
+        for i in range(self._rows):
+            yield self[i]
+    
+    def __repr__(self) -> str:
+        """Return a short description of the matrix."""
+        return f"PolynomialMatrix(rows={self._rows}, degree={self.degree})"
+    
+    def _check_rows(self, other: 'PolynomialMatrix') -> None:
+        """Raise ValueError unless other has as many rows as self."""
+        if other._rows != self._rows:
+            raise ValueError("PolynomialMatrix operands must have the same number of rows")
+    
+    def _add(self, other, op) -> 'PolynomialMatrix':
+        """Shared implementation of + and - (op is operator.add or operator.sub)."""
+        if isinstance(other, _SCALAR_TYPES):
+            other = Polynomial([other])
+        
+        if isinstance(other, Polynomial):
+            width = max(self._width, len(other._coeffs))
+            data = array('d', self._widened(width))
+            for j, c in enumerate(other._coeffs):
+                if c:
+                    data[j::width] = array('d', map(op, data[j::width], repeat(c)))
+            return PolynomialMatrix._from_flat(data, self._rows, width)
+        
+        if isinstance(other, PolynomialMatrix):
+            self._check_rows(other)
+            width = max(self._width, other._width)
+            data = array('d', map(op, self._widened(width), other._widened(width)))
+            return PolynomialMatrix._from_flat(data, self._rows, width)
+        
+        return NotImplemented
+    
+    def __add__(self, other: Union['PolynomialMatrix', Polynomial, float]) -> 'PolynomialMatrix':
+        """Add row by row, or add a polynomial or constant to every row."""
+        return self._add(other, add)
+    
+    def __radd__(self, other: Union[Polynomial, float]) -> 'PolynomialMatrix':
+        """Right addition."""
+        return self._add(other, add)
+    
+    def __sub__(self, other: Union['PolynomialMatrix', Polynomial, float]) -> 'PolynomialMatrix':
+        """Subtract row by row, or subtract a polynomial or constant from every row."""
+        return self._add(other, sub)
+    
+    def __rsub__(self, other: Union[Polynomial, float]) -> 'PolynomialMatrix':
+        """Right subtraction."""
+        return (self * -1)._add(other, add)
+    
+    def __mul__(self, other: Union['PolynomialMatrix', Polynomial, float]) -> 'PolynomialMatrix':
+        """
+        Multiply row by row, or multiply every row by a polynomial or constant.
+        
+        Products use the schoolbook method over columns: each column of the
+        result is built in one pass over the rows.
+        """
+        if isinstance(other, _SCALAR_TYPES):
+            data = array('d', map(mul, self._data, repeat(other)))
+            return PolynomialMatrix._from_flat(data, self._rows, self._width)
+        
+        if isinstance(other, Polynomial):
+            right = [array('d', repeat(c, self._rows)) for c in other._coeffs]
+        elif isinstance(other, PolynomialMatrix):
+            self._check_rows(other)
+            right = [other._column(j) for j in range(other._width)]
+        else:
+            return NotImplemented
+        
+        # Column k of the product is the row-wise sum of left[i] * right[k - i]
+        left = [self._column(i) for i in range(self._width)]
+        width = len(left) + len(right) - 1
+        data = array('d', bytes(8 * self._rows * width))
+        for k in range(width):
+            first = max(0, k - len(right) + 1)
+            last = min(k, len(left) - 1)
+            terms = [map(mul, left[i], right[k - i]) for i in range(first, last + 1)]
+            data[k::width] = array('d', map(sum, zip(*terms)))
+        return PolynomialMatrix._from_flat(data, self._rows, width)
+    
+    def __rmul__(self, other: Union[Polynomial, float]) -> 'PolynomialMatrix':
+        """Right multiplication."""
+        return self.__mul__(other)
+    
+    def __pow__(self, n: int) -> 'PolynomialMatrix':
+        """Raise every row to an integer power."""
+        if not isinstance(n, int) or n < 0:
+            raise ValueError("Power must be a non-negative integer")
+        
+        result = PolynomialMatrix._from_flat(array('d', repeat(1.0, self._rows)), self._rows, 1)
+        base = self
+        while n > 0:
+            if n % 2 == 1:
+                result = result * base
+            n //= 2
+            if n:
+                base = base * base
+        
+        return result
+    
+    def evaluate(self, x: Union[float, Sequence[float]]) -> array:
+        """
+        Evaluate every row with Horner's method, one column at a time.
+        
+        Args:
+            x: One point for all rows, or a sequence with one point per row
+            
+        Returns:
+            array('d') with one value per row
+        """
+        scalar = isinstance(x, _SCALAR_TYPES)
+        if not scalar and len(x) != self._rows:
+            raise ValueError("Need one point per row")
+        
+        values = self._column(self._width - 1)
+        for j in range(self._width - 2, -1, -1):
+            points = repeat(x) if scalar else x
+            values = array('d', map(add, map(mul, values, points), self._column(j)))
+        
+        return values
+    
+    def __call__(self, x: Union[float, Sequence[float]]) -> array:
+        """Evaluate every row; see evaluate()."""
+        return self.evaluate(x)
+    
+    def derivative(self, n: int = 1) -> 'PolynomialMatrix':
+        """
+        Compute the nth derivative of every row.
+        
+        Args:
+            n: Order of the derivative (default: 1)
+            
+        Returns:
+            A new PolynomialMatrix
+        """
+        if n < 0:
+            raise ValueError("Derivative order must be non-negative")
+        
+        result = self
+        for _ in range(n):
+            width = result._width - 1
+            if width == 0:
+                return PolynomialMatrix._from_flat(array('d', bytes(8 * self._rows)), self._rows, 1)
+            data = array('d', bytes(8 * self._rows * width))
+            for j in range(1, result._width):
+                data[j - 1::width] = array('d', map(mul, result._column(j), repeat(j)))
+            result = PolynomialMatrix._from_flat(data, self._rows, width)
+        
+        return result
+    
+    def integrate(self, constant: float = 0.0) -> 'PolynomialMatrix':
+        """
+        Compute the indefinite integral of every row.
+        
+        Args:
+            constant: The constant of integration for every row (default: 0)
+            
+        Returns:
+            A new PolynomialMatrix
+        """
+        width = self._width + 1
+        data = array('d', bytes(8 * self._rows * width))
+        if constant:
+            data[0::width] = array('d', repeat(constant, self._rows))
+        for j in range(self._width):
+            data[j + 1::width] = array('d', map(truediv, self._column(j), repeat(j + 1)))
+        return PolynomialMatrix._from_flat(data, self._rows, width)
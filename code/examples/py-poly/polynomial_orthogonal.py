@@ -0,0 +1,513 @@
+"""
+Orthogonal Polynomial Bases
+
+Chebyshev and Legendre series on [-1, 1]. High-degree fits are far better
+conditioned in these bases than in the monomial basis of Polynomial, and
+they are evaluated with Clenshaw's recurrence instead of Horner's method.
+
+Chebyshev series convert to and from values at Chebyshev nodes with a
+discrete cosine transform built on the FFT of polynomial.py (O(n log n) for
+any n), which gives interpolation at Chebyshev nodes. Both bases convert to
+and from Polynomial with their three-term recurrences in O(n^2).
+"""
+
+from typing import Callable, List, Sequence, Union
+from array import array
+import cmath
+import math
+
+from polynomial import Polynomial, _SCALAR_TYPES, _fft, _is_batch, _multiply
+
+
+def _dft(values: Sequence[complex], sign: int) -> List[complex]:
+    """
+    Unnormalized DFT of any length: X_k = sum_j values[j] * exp(sign * 2*pi*i*j*k / n).
+    
+    Power-of-two lengths use _fft directly; other lengths go through
+    Bluestein's algorithm (a power-of-two convolution), so the cost is
+    O(n log n) either way.
+    """
+    n = len(values)
+    if n & (n - 1) == 0:
+        result = list(values)
+        _fft(result, invert=sign > 0)
+        return [v * n for v in result] if sign > 0 else result
+    
+    # Bluestein: 2jk = j^2 + k^2 - (k - j)^2 turns the DFT into a convolution
+    chirp = [cmath.exp(sign * 1j * math.pi * (k * k % (2 * n)) / n) for k in range(n)]
+    size = 1
+    while size < 2 * n - 1:
+        size <<= 1
+    
+    a = [v * w for v, w in zip(values, chirp)] + [0j] * (size - n)
+    b = [0j] * size
+    b[0] = chirp[0].conjugate()
+    for k in range(1, n):
+        b[k] = b[size - k] = chirp[k].conjugate()
+    
+    _fft(a)
+    _fft(b)
+    product = [x * y for x, y in zip(a, b)]
+    _fft(product, invert=True)
+    return [product[k] * chirp[k] for k in range(n)]
+
+
+def _dct_values_to_coefficients(values: Sequence[float]) -> List[float]:
+    """Chebyshev coefficients of the interpolant through values at the n Chebyshev nodes (DCT-II)."""
+    n = len(values)
+    spectrum = _dft(list(values) + [0.0] * n, -1)
+    coeffs = [2.0 / n * (cmath.exp(-1j * math.pi * k / (2 * n)) * spectrum[k]).real for k in range(n)]
+    coeffs[0] /= 2
+    return coeffs
+
+
+def _dct_coefficients_to_values(coeffs: Sequence[float], n: int) -> List[float]:
+    """Values of a Chebyshev series at the n Chebyshev nodes (DCT-III); len(coeffs) <= n."""
+    twisted = [c * cmath.exp(1j * math.pi * k / (2 * n)) for k, c in enumerate(coeffs)]
+    spectrum = _dft(twisted + [0j] * (2 * n - len(twisted)), 1)
+    return [spectrum[j].real for j in range(n)]
+
+
+class _OrthogonalSeries:
+    """
+    Shared storage and arithmetic of Chebyshev and Legendre series.
+    
+    Coefficients are stored in an array('d') in ascending order of degree,
+    without zero trailing terms.
+    """
+    
+    __slots__ = ('_coeffs',)
+    
+    def __init__(self, coefficients: Sequence[float]):
+        """
+        Initialize a series from its coefficients.
+        
+        Args:
+            coefficients: Coefficients of the basis polynomials in ascending
+                          order of degree; [c0, c1, c2] is c0*B0 + c1*B1 + c2*B2
+        """
+        coeffs = array('d', coefficients)
+        if not coeffs:
+            coeffs.append(0.0)
+        # Only exact zeros are trimmed: small trailing coefficients matter in
+        # these bases; truncate() drops them relative to the largest one
+        length = Polynomial._trimmed_length(coeffs, exact=True)
+        del coeffs[length:]
+        self._coeffs = coeffs
+    
+    @property
+    def coefficients(self) -> List[float]:
+        """Return the coefficients in ascending order of degree as a new list."""
+        return self._coeffs.tolist()
+    
+    @property
+    def degree(self) -> int:
+        """Return the degree of the series."""
+        return len(self._coeffs) - 1
+    
+    def truncate(self, tol: float = 1e-14) -> '_OrthogonalSeries':
+        """
+        Drop trailing coefficients that are negligible.
+        
+        Coefficients of smooth functions decay quickly in these bases, so
+        a high-degree interpolant can usually be cut to a much lower degree
+        with no loss of accuracy.
+        
+        Args:
+            tol: Coefficients below tol times the largest one are dropped
+            
+        Returns:
+            A new, possibly shorter series
+        """
+        coeffs = self._coeffs
+        cutoff = tol * max(map(abs, coeffs))
+        length = len(coeffs)
+        while length > 1 and abs(coeffs[length - 1]) <= cutoff:
+            length -= 1
+        return self.__class__(coeffs[:length])
+    
+    def __repr__(self) -> str:
+        """Return a string representation of the series."""
+        return f"{self.__class__.__name__}({self._coeffs.tolist()})"
+    
+    def __eq__(self, other) -> bool:
+        """Check if two series in the same basis are equal."""
+        if type(other) is not type(self):
+            return NotImplemented
+        if len(self._coeffs) != len(other._coeffs):
+            return False
+        return all(abs(a - b) < 1e-10 for a, b in zip(self._coeffs, other._coeffs))
+    
+    def _combine(self, other, sign: float) -> '_OrthogonalSeries':
+        """Coefficient-wise self + sign * other."""
+        if isinstance(other, _SCALAR_TYPES):
+            other = self.__class__([other])
+        if type(other) is not type(self):
+            return NotImplemented
+        length = max(len(self._coeffs), len(other._coeffs))
+        result = [0.0] * length
+        for i, c in enumerate(self._coeffs):
+            result[i] = c
+        for i, c in enumerate(other._coeffs):
+            result[i] += sign * c
+        return self.__class__(result)
+    
+    def __add__(self, other: Union['_OrthogonalSeries', float]) -> '_OrthogonalSeries':
+        """Add a series in the same basis or a constant."""
+        return self._combine(other, 1.0)
+    
+    def __radd__(self, other: float) -> '_OrthogonalSeries':
+        """Right addition."""
+        return self._combine(other, 1.0)
+    
+    def __sub__(self, other: Union['_OrthogonalSeries', float]) -> '_OrthogonalSeries':
+        """Subtract a series in the same basis or a constant."""
+        return self._combine(other, -1.0)
+    
+    def __rsub__(self, other: float) -> '_OrthogonalSeries':
+        """Right subtraction."""
+        return (self * -1)._combine(other, 1.0)
+    
+    def __mul__(self, other: float) -> '_OrthogonalSeries':
+        """Multiply by a constant."""
+        if isinstance(other, _SCALAR_TYPES):
+            return self.__class__([c * other for c in self._coeffs])
+        return NotImplemented
+    
+    def __rmul__(self, other: float) -> '_OrthogonalSeries':
+        """Right multiplication."""
+        return self.__mul__(other)
+    
+    def __call__(self, x: float) -> float:
+        """
+        Evaluate the series with Clenshaw's recurrence.
+        
+        Lists, tuples, array.array, buffers and NumPy arrays give a list of
+        values.
+        """
+        if _is_batch(x):
+            return [self._clenshaw(value) for value in x]
+        return self._clenshaw(x)
+    
+    def evaluate(self, x: float) -> float:
+        """
+        Evaluate the series at a given value.
+        
+        Args:
+            x: The value (or container of values) at which to evaluate
+            
+        Returns:
+            The value of the series at x
+        """
+        return self(x)
+    
+    def derivative(self, n: int = 1) -> '_OrthogonalSeries':
+        """
+        Compute the nth derivative of the series, in the same basis.
+        
+        Args:
+            n: Order of the derivative (default: 1)
+            
+        Returns:
+            The nth derivative as a new series
+        """
+        if n < 0:
+            raise ValueError("Derivative order must be non-negative")
+        coeffs = self._coeffs.tolist()
+        for _ in range(n):
+            if len(coeffs) == 1:
+                return self.__class__([0.0])
+            coeffs = self._derivative(coeffs)
+        return self.__class__(coeffs)
+    
+    def integrate(self, constant: float = 0.0) -> '_OrthogonalSeries':
+        """
+        Compute the indefinite integral of the series, in the same basis.
+        
+        Args:
+            constant: Value of the integral at x = 0 (default: 0), as for
+                      Polynomial.integrate()
+                      
+        Returns:
+            The integral as a new series
+        """
+        coeffs = self._integrate(self._coeffs.tolist())
+        coeffs[0] += constant - self.__class__(coeffs)(0.0)
+        return self.__class__(coeffs)
+    
+    def definite_integral(self, a: float, b: float) -> float:
+        """
+        Compute the definite integral from a to b.
+        
+        Args:
+            a: Lower bound
+            b: Upper bound
+            
+        Returns:
+            The value of the definite integral
+        """
+        antiderivative = self.integrate()
+        return antiderivative(b) - antiderivative(a)
+
+
+class Chebyshev(_OrthogonalSeries):
+    """
+    A Chebyshev series sum(c[k] * T_k(x)) on [-1, 1].
+    
+    Example:
+        >>> f = Chebyshev.interpolate(math.exp, 20).truncate()
+        >>> abs(f(0.5) - math.exp(0.5)) < 1e-14
+        True
+    """
+    
+    __slots__ = ()
+    
+    @staticmethod
+    def nodes(n: int) -> List[float]:
+        """Return the n Chebyshev points of the first kind, cos(pi*(j + 1/2)/n), in decreasing order."""
+        if n < 1:
+            raise ValueError("Need at least one node")
+        return [math.cos(math.pi * (j + 0.5) / n) for j in range(n)]
+    
+    @classmethod
+    def interpolate(cls, f: Union[Callable[[float], float], Sequence[float]], n: Union[int, None] = None) -> 'Chebyshev':
+        """
+        Interpolate at the Chebyshev nodes.
+        
+        Args:
+            f: A function to sample at Chebyshev.nodes(n), or its values there
+            n: Number of nodes (degree + 1); taken from len(f) for values
+            
+        Returns:
+            The Chebyshev series of degree < n through the samples, computed
+            with one DCT in O(n log n)
+        """
+        if callable(f):
+            if n is None:
+                raise ValueError("Number of nodes is required when interpolating a function")
+            values = [f(x) for x in cls.nodes(n)]
+        else:
+            values = list(f)
+            if n is not None and n != len(values):
+                raise ValueError("Need exactly n values")
+            if not values:
+                raise ValueError("Need at least one value")
+        return cls(_dct_values_to_coefficients(values))
+    
+    def values(self, n: Union[int, None] = None) -> List[float]:
+        """
+        Return the values at the n Chebyshev nodes with one inverse DCT.
+        
+        Args:
+            n: Number of nodes; at least degree + 1 (default)
+            
+        Returns:
+            Values at Chebyshev.nodes(n), in the same order
+        """
+        if n is None:
+            n = len(self._coeffs)
+        if n < len(self._coeffs):
+            raise ValueError("Need at least degree + 1 nodes")
+        return _dct_coefficients_to_values(self._coeffs, n)
+    
+    @classmethod
+    def from_polynomial(cls, poly: Polynomial) -> 'Chebyshev':
+        """
+        Convert a Polynomial to the Chebyshev basis (Horner's method in the Chebyshev basis).
+        
+        Args:
+            poly: The polynomial in the monomial basis
+            
+        Returns:
+            The same polynomial as a Chebyshev series
+        """
+        coeffs = [float(c) for c in poly._coeffs]
+        result = [coeffs[-1]]
+        for a in reversed(coeffs[:-1]):
+            # Multiply by x: x*T_0 = T_1, x*T_i = (T_{i+1} + T_{i-1}) / 2
+            product = [0.0] * (len(result) + 1)
+            product[1] = result[0]
+            for i in range(1, len(result)):
+                product[i + 1] += result[i] / 2
+                product[i - 1] += result[i] / 2
+            product[0] += a
+            result = product
+        return cls(result)
+    
+    def to_polynomial(self) -> Polynomial:
+        """
+        Convert to a Polynomial in the monomial basis (Clenshaw's recurrence on coefficient lists).
+        
+        Monomial coefficients of high-degree Chebyshev series are large and
+        cancel; expect to lose accuracy at high degree.
+        
+        Returns:
+            The same polynomial in the monomial basis
+        """
+        coeffs = self._coeffs
+        n = len(coeffs) - 1
+        b1 = [0.0]
+        b2 = [0.0]
+        for k in range(n, 0, -1):
+            # b_k = c_k + 2x * b_{k+1} - b_{k+2}
+            b = [0.0] + [2 * v for v in b1]
+            for i, v in enumerate(b2):
+                b[i] -= v
+            b[0] += coeffs[k]
+            b1, b2 = b, b1
+        result = [0.0] + b1
+        for i, v in enumerate(b2):
+            result[i] -= v
+        result[0] += coeffs[0]
+        return Polynomial(result)
+    
+    def _clenshaw(self, x: float) -> float:
+        """Evaluate sum(c[k] * T_k(x)) with Clenshaw's recurrence."""
+        coeffs = self._coeffs
+        b1 = b2 = 0.0
+        two_x = 2 * x
+        for k in range(len(coeffs) - 1, 0, -1):
+            b1, b2 = coeffs[k] + two_x * b1 - b2, b1
+        return coeffs[0] + x * b1 - b2
+    
+    @staticmethod
+    def _derivative(coeffs: List[float]) -> List[float]:
+        """Chebyshev coefficients of the derivative (len(coeffs) >= 2)."""
+        c = list(coeffs)
+        n = len(c) - 1
+        der = [0.0] * n
+        for j in range(n, 2, -1):
+            der[j - 1] = 2 * j * c[j]
+            c[j - 2] += j * c[j] / (j - 2)
+        if n > 1:
+            der[1] = 4 * c[2]
+        der[0] = c[1]
+        return der
+    
+    @staticmethod
+    def _integrate(coeffs: List[float]) -> List[float]:
+        """Chebyshev coefficients of an antiderivative (constant term arbitrary)."""
+        n = len(coeffs)
+        result = [0.0] * (n + 1)
+        result[1] = coeffs[0]
+        if n > 1:
+            result[2] = coeffs[1] / 4
+        for j in range(2, n):
+            result[j + 1] = coeffs[j] / (2 * (j + 1))
+            result[j - 1] -= coeffs[j] / (2 * (j - 1))
+        return result
+    
+    def __mul__(self, other: Union['Chebyshev', float]) -> 'Chebyshev':
+        """
+        Multiply by a constant or another Chebyshev series.
+        
+        T_m * T_n = (T_{m+n} + T_{|m-n|}) / 2, so the product is one
+        convolution of the symmetrically extended coefficients (Karatsuba or
+        FFT via polynomial.py).
+        """
+        if not isinstance(other, Chebyshev):
+            return super().__mul__(other)
+        
+        def symmetric(coeffs):
+            half = [c / 2 for c in coeffs[1:]]
+            return half[::-1] + [coeffs[0]] + half
+        
+        product = _multiply(symmetric(self._coeffs), symmetric(other._coeffs))
+        center = len(product) // 2
+        result = [product[center]] + [2 * c for c in product[center + 1:]]
+        return Chebyshev(result)
+
+
+class Legendre(_OrthogonalSeries):
+    """
+    A Legendre series sum(c[k] * P_k(x)) on [-1, 1].
+    
+    Conversion to and from Polynomial uses the three-term recurrence and
+    costs O(n^2).
+    """
+    
+    __slots__ = ()
+    
+    @classmethod
+    def from_polynomial(cls, poly: Polynomial) -> 'Legendre':
+        """
+        Convert a Polynomial to the Legendre basis (Horner's method in the Legendre basis).
+        
+        Args:
+            poly: The polynomial in the monomial basis
+            
+        Returns:
+            The same polynomial as a Legendre series
+        """
+        coeffs = [float(c) for c in poly._coeffs]
+        result = [coeffs[-1]]
+        for a in reversed(coeffs[:-1]):
+            # Multiply by x: x*P_i = ((i + 1)*P_{i+1} + i*P_{i-1}) / (2i + 1)
+            product = [0.0] * (len(result) + 1)
+            product[1] = result[0]
+            for i in range(1, len(result)):
+                product[i + 1] += result[i] * (i + 1) / (2 * i + 1)
+                product[i - 1] += result[i] * i / (2 * i + 1)
+            product[0] += a
+            result = product
+        return cls(result)
+    
+    def to_polynomial(self) -> Polynomial:
+        """
+        Convert to a Polynomial in the monomial basis (Clenshaw's recurrence on coefficient lists).
+        
+        Returns:
+            The same polynomial in the monomial basis
+        """
+        coeffs = self._coeffs
+        n = len(coeffs) - 1
+        b1 = [0.0]
+        b2 = [0.0]
+        for k in range(n, 0, -1):
+            # b_k = c_k + (2k + 1)/(k + 1) * x * b_{k+1} - (k + 1)/(k + 2) * b_{k+2}
+            alpha = (2 * k + 1) / (k + 1)
+            beta = (k + 1) / (k + 2)
+            b = [0.0] + [alpha * v for v in b1]
+            for i, v in enumerate(b2):
+                b[i] -= beta * v
+            b[0] += coeffs[k]
+            b1, b2 = b, b1
+        result = [0.0] + b1
+        for i, v in enumerate(b2):
+            result[i] -= 0.5 * v
+        result[0] += coeffs[0]
+        return Polynomial(result)
+    
+    def _clenshaw(self, x: float) -> float:
+        """Evaluate sum(c[k] * P_k(x)) with Clenshaw's recurrence."""
+        coeffs = self._coeffs
+        b1 = b2 = 0.0
+        for k in range(len(coeffs) - 1, 0, -1):
+            b1, b2 = coeffs[k] + (2 * k + 1) / (k + 1) * x * b1 - (k + 1) / (k + 2) * b2, b1
+        return coeffs[0] + x * b1 - 0.5 * b2
+    
+    @staticmethod
+    def _derivative(coeffs: List[float]) -> List[float]:
+        """Legendre coefficients of the derivative (len(coeffs) >= 2)."""
+        c = list(coeffs)
+        n = len(c) - 1
+        der = [0.0] * n
+        for j in range(n, 2, -1):
+            der[j - 1] = (2 * j - 1) * c[j]
+            c[j - 2] += c[j]
+        if n > 1:
+            der[1] = 3 * c[2]
+        der[0] = c[1]
+        return der
+    
+    @staticmethod
+    def _integrate(coeffs: List[float]) -> List[float]:
+        """Legendre coefficients of an antiderivative (constant term arbitrary)."""
+        n = len(coeffs)
+        result = [0.0] * (n + 1)
+        result[1] = coeffs[0]
+        for j in range(1, n):
+            t = coeffs[j] / (2 * j + 1)
+            result[j + 1] = t
+            result[j - 1] -= t
+        return result
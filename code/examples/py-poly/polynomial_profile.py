@@ -0,0 +1,267 @@
+"""
+Polynomial Profiling
+
+Opt-in instrumentation for Polynomial operations. enable() replaces the
+methods listed in PROFILED_METHODS with wrappers that record call counts,
+cumulative time, the distribution of input degrees and the number of
+Polynomial objects created during each call; disable() puts the original
+methods back, so there is no overhead at all while profiling is off.
+
+    import polynomial_profile
+    
+    with polynomial_profile.profiling(trace=True):
+        run_workload()
+    polynomial_profile.report()
+    polynomial_profile.export_chrome_trace('polynomial-trace.json')
+    
+Times and object counts are inclusive: an operation that calls other
+profiled methods (__pow__ calls __mul__, __call__ on a batch calls
+evaluate_many) includes their cost, and the inner calls are recorded as
+well. compose works on raw coefficient lists (a Taylor shift for affine
+inner polynomials, otherwise divide and conquer over precomputed powers of
+the inner polynomial), so its products appear only in its own time, not as
+__mul__ calls. Profiling is meant for one thread at a time.
+"""
+
+from typing import Dict, List, TextIO, Union
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+import functools
+import json
+import os
+import sys
+import threading
+import tracemalloc
+
+from polynomial import Polynomial
+
+
+# Instance methods wrapped by enable()
+PROFILED_METHODS = (
+    '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__',
+    '__iadd__', '__isub__', '__imul__', '__truediv__', '__pow__', '__call__',
+    'evaluate_many', 'multipoint_evaluate', 'derivative', 'integrate',
+    'definite_integral', 'divmod', 'compose', 'gcd', 'roots', 'real_roots',
+    'to_string', 'to_bytes', 'copy',
+)
+
+
+class OperationStats:
+    """Counters for one profiled operation."""
+    
+    __slots__ = ('name', 'calls', 'total_time', 'max_time', 'degrees', 'objects', 'bytes')
+    
+    def __init__(self, name: str):
+        """Create empty counters for the operation called name."""
+        self.name = name
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.degrees = Counter()    # degree bucket (bit length of the degree) -> calls
+        self.objects = 0            # Polynomial objects created during the calls
+        self.bytes = 0              # net bytes allocated, if allocations are traced
+    
+    def as_dict(self) -> dict:
+        """Return the counters as a plain dict (degree buckets as "lo-hi" labels)."""
+        return {
+            'calls': self.calls,
+            'total_time': self.total_time,
+            'max_time': self.max_time,
+            'degrees': {_bucket_label(b): n for b, n in sorted(self.degrees.items())},
+            'objects': self.objects,
+            'bytes': self.bytes,
+        }
+
+
+_stats: Dict[str, OperationStats] = {}
+_originals: Dict[str, object] = {}
+_trace_events: List[dict] = []
+_created = [0]
+_options = {'trace': False, 'max_trace_events': 0, 'track_allocations': False, 'dropped_events': 0}
+
+
+def _bucket_label(bucket: int) -> str:
+    """Label of a degree bucket: degrees with the same bit length share one."""
+    if bucket == 0:
+        return "0"
+    low, high = 1 << (bucket - 1), (1 << bucket) - 1
+    return str(low) if low == high else f"{low}-{high}"
+
+
+def _record(name: str, degree: int, start: float, elapsed: float, objects: int, allocated: int) -> None:
+    """Add one call to the statistics (and the trace, if enabled)."""
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats[name] = OperationStats(name)
+    stats.calls += 1
+    stats.total_time += elapsed
+    if elapsed > stats.max_time:
+        stats.max_time = elapsed
+    stats.degrees[degree.bit_length()] += 1
+    stats.objects += objects
+    stats.bytes += allocated
+    
+    if _options['trace']:
+        if len(_trace_events) < _options['max_trace_events']:
+            _trace_events.append({
+                'name': name, 'ph': 'X', 'ts': start * 1e6, 'dur': elapsed * 1e6,
+                'pid': os.getpid(), 'tid': threading.get_ident(),
+                'args': {'degree': degree, 'objects': objects},
+            })
+        else:
+            _options['dropped_events'] += 1
+
+
+def _wrap(name: str, function):
+    """Return a recording wrapper around a Polynomial method."""
+    track_allocations = _options['track_allocations']
+    
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        degree = len(self._coeffs) - 1
+        created = _created[0]
+        allocated = tracemalloc.get_traced_memory()[0] if track_allocations else 0
+        start = perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            if track_allocations:
+                allocated = tracemalloc.get_traced_memory()[0] - allocated
+            _record(name, degree, start, elapsed, _created[0] - created, allocated)
+    
+    return wrapper
+
+
+def _counting_init(function):
+    """Wrap Polynomial.__init__ to count constructed objects."""
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        _created[0] += 1
+        function(self, *args, **kwargs)
+    return wrapper
+
+
+def _counting_from_array(function):
+    """Wrap the function behind Polynomial._from_array to count constructed objects."""
+    @functools.wraps(function)
+    def wrapper(cls, coeffs):
+        _created[0] += 1
+        return function(cls, coeffs)
+    return classmethod(wrapper)
+
+
+def is_enabled() -> bool:
+    """Return True while Polynomial methods are instrumented."""
+    return bool(_originals)
+
+
+def enable(trace: bool = False, max_trace_events: int = 1_000_000,
+           track_allocations: bool = False) -> None:
+    """
+    Start recording Polynomial operations.
+    
+    Args:
+        trace: Also keep one event per call for export_chrome_trace()
+        max_trace_events: Stop adding trace events after this many (later
+                          calls are still counted)
+        track_allocations: Also record net bytes allocated per operation with
+                           tracemalloc (slows every allocation down noticeably)
+    """
+    if _originals:
+        disable()
+    
+    _options.update(trace=trace, max_trace_events=max_trace_events,
+                    track_allocations=track_allocations)
+    if track_allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _options['started_tracemalloc'] = True
+    
+    for name in PROFILED_METHODS + ('__init__', '_from_array'):
+        _originals[name] = Polynomial.__dict__[name]
+    
+    for name in PROFILED_METHODS:
+        setattr(Polynomial, name, _wrap(name, _originals[name]))
+    Polynomial.__init__ = _counting_init(_originals['__init__'])
+    Polynomial._from_array = _counting_from_array(_originals['_from_array'].__func__)
+
+
+def disable() -> None:
+    """Stop recording and restore the original Polynomial methods (statistics are kept)."""
+    for name, original in _originals.items():
+        setattr(Polynomial, name, original)
+    _originals.clear()
+    
+    if _options.pop('started_tracemalloc', False):
+        tracemalloc.stop()
+
+
+def reset() -> None:
+    """Clear all statistics and trace events."""
+    _stats.clear()
+    _trace_events.clear()
+    _options['dropped_events'] = 0
+
+
+@contextmanager
+def profiling(**options):
+    """
+    Record Polynomial operations inside a with block.
+    
+    Args:
+        **options: Passed to enable()
+    """
+    enable(**options)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def stats() -> Dict[str, dict]:
+    """Return the statistics per operation as plain dicts."""
+    return {name: s.as_dict() for name, s in _stats.items()}
+
+
+def report(file: Union[TextIO, None] = None, sort: str = 'total_time', limit: Union[int, None] = None) -> None:
+    """
+    Print a summary table of the recorded operations.
+    
+    Args:
+        file: Output stream (default: sys.stdout)
+        sort: OperationStats field to sort by, largest first ('total_time',
+              'calls', 'objects', 'max_time' or 'bytes')
+        limit: Show at most this many operations
+    """
+    file = file or sys.stdout
+    rows = sorted(_stats.values(), key=lambda s: getattr(s, sort), reverse=True)[:limit]
+    
+    print(f"{'operation':<20} {'calls':>9} {'total s':>10} {'mean us':>10} {'max us':>10} "
+          f"{'objs/call':>9} {'KiB':>9}  degrees", file=file)
+    print("-" * 100, file=file)
+    for s in rows:
+        degrees = " ".join(f"{_bucket_label(b)}:{n}" for b, n in sorted(s.degrees.items()))
+        kib = f"{s.bytes / 1024:>9.1f}" if _options['track_allocations'] else f"{'-':>9}"
+        print(f"{s.name:<20} {s.calls:>9} {s.total_time:>10.4f} {s.total_time / s.calls * 1e6:>10.1f} "
+              f"{s.max_time * 1e6:>10.1f} {s.objects / s.calls:>9.1f} {kib}  {degrees}", file=file)
+    if _options['dropped_events']:
+        print(f"({_options['dropped_events']} trace events dropped)", file=file)
+
+
+def export_chrome_trace(path: str) -> int:
+    """
+    Write the recorded trace events in Chrome trace-event JSON format.
+    
+    The file opens in chrome://tracing, Perfetto or speedscope. Requires
+    enable(trace=True).
+    
+    Args:
+        path: Output file
+        
+    Returns:
+        The number of events written
+    """
+    with open(path, 'w') as file:
+        json.dump({'traceEvents': _trace_events, 'displayTimeUnit': 'ms'}, file)
+    return len(_trace_events)
@@ -0,0 +1,477 @@
+"""
+Sparse Polynomials
+
+SparsePolynomial stores only the non-zero terms of a polynomial, as sorted
+exponents and their coefficients, so x^1000000 + 1 takes two terms instead of
+a million coefficients. It supports the same operators as Polynomial and the
+two mix freely; results are returned dense or sparse depending on how many
+of their coefficients are non-zero.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+from array import array
+import math
+
+from polynomial import Polynomial, _SCALAR_TYPES, _format_term, _is_batch, _join_terms, _np
+
+
+# Results whose non-zero terms fill more than this fraction of degree + 1 are
+# returned as a dense Polynomial; sparser results stay SparsePolynomial.
+SPARSE_FILL_RATIO = 0.25
+
+# Results with fewer coefficients than this are always dense.
+SPARSE_MIN_LENGTH = 64
+
+
+def _fill_ratio(term_count: int, length: int) -> float:
+    """Return the fraction of the length coefficients that are non-zero."""
+    return term_count / length if length else 1.0
+
+
+def _is_dense_fill(term_count: int, length: int) -> bool:
+    """Return True if a polynomial of this shape is better stored densely."""
+    return length < SPARSE_MIN_LENGTH or _fill_ratio(term_count, length) > SPARSE_FILL_RATIO
+
+
+def _power(x: float, n: int) -> float:
+    """Return x ** n, saturating to an infinity like repeated multiplication would."""
+    try:
+        return x ** n
+    except OverflowError:
+        if isinstance(x, float):
+            return -math.inf if x < 0 and n % 2 else math.inf
+        raise
+
+
+def _dense_array(exponents: Sequence[int], coeffs: Sequence[float]) -> array:
+    """Scatter the terms into a packed array of length degree + 1."""
+    length = exponents[-1] + 1 if exponents else 1
+    result = array('d', bytes(8 * length))
+    for e, c in zip(exponents, coeffs):
+        result[e] = c
+    return result
+
+
+def _result(exponents: Sequence[int], coeffs: Sequence[float]) -> Union['SparsePolynomial', Polynomial]:
+    """
+    Build an operation result in the representation that suits its fill.
+    
+    Args:
+        exponents: Increasing exponents
+        coeffs: Matching coefficients; near-zero ones are dropped
+        
+    Returns:
+        A Polynomial if the terms are dense enough, otherwise a SparsePolynomial
+    """
+    if any(abs(c) < 1e-10 for c in coeffs):
+        kept = [(e, c) for e, c in zip(exponents, coeffs) if abs(c) >= 1e-10]
+        exponents = [e for e, _ in kept]
+        coeffs = [c for _, c in kept]
+    
+    length = exponents[-1] + 1 if exponents else 1
+    if _is_dense_fill(len(exponents), length):
+        return Polynomial._from_array(_dense_array(exponents, coeffs))
+    return SparsePolynomial._from_arrays(array('q', exponents), array('d', coeffs))
+
+
+def _from_mapping(terms: Dict[int, float]) -> Union['SparsePolynomial', Polynomial]:
+    """Build a result from an exponent -> coefficient dict (any order)."""
+    exponents = sorted(terms)
+    return _result(exponents, [terms[e] for e in exponents])
+
+
+def _merge(e1: Sequence[int], c1: Sequence[float], e2: Sequence[int],
+           c2: Sequence[float], sign: float) -> Tuple[List[int], List[float]]:
+    """Merge two sorted term lists into the terms of (1) + sign * (2)."""
+    exponents = []
+    coeffs = []
+    i = j = 0
+    n1, n2 = len(e1), len(e2)
+    while i < n1 or j < n2:
+        if j == n2 or (i < n1 and e1[i] < e2[j]):
+            e, c = e1[i], c1[i]
+            i += 1
+        elif i == n1 or e2[j] < e1[i]:
+            e, c = e2[j], sign * c2[j]
+            j += 1
+        else:
+            e, c = e1[i], c1[i] + sign * c2[j]
+            i += 1
+            j += 1
+        if abs(c) >= 1e-10:
+            exponents.append(e)
+            coeffs.append(c)
+    return exponents, coeffs
+
+
+def _terms_of(other) -> Union[Tuple[Sequence[int], Sequence[float]], None]:
+    """Return the sorted (exponents, coefficients) of an operand, or None."""
+    if isinstance(other, SparsePolynomial):
+        return other._exponents, other._coeffs
+    if isinstance(other, _SCALAR_TYPES):
+        return ([0], [float(other)]) if abs(other) >= 1e-10 else ([], [])
+    if isinstance(other, Polynomial):
+        sparse = SparsePolynomial.from_dense(other)
+        return sparse._exponents, sparse._coeffs
+    return None
+
+
+def to_best_representation(poly: Union['SparsePolynomial', Polynomial]) -> Union['SparsePolynomial', Polynomial]:
+    """
+    Return poly stored densely or sparsely, whichever suits its fill ratio.
+    
+    Args:
+        poly: A Polynomial or SparsePolynomial
+        
+    Returns:
+        The same polynomial, converted if the other representation fits better
+    """
+    if isinstance(poly, SparsePolynomial):
+        return _result(poly._exponents, poly._coeffs)
+    if isinstance(poly, Polynomial):
+        sparse = SparsePolynomial.from_dense(poly)
+        if _is_dense_fill(len(sparse._exponents), len(poly._coeffs)):
+            return poly
+        return sparse
+    raise TypeError("Expected a Polynomial or SparsePolynomial")
+
+
+class SparsePolynomial:
+    """
+    A polynomial stored as its non-zero terms.
+    
+    Exponents are kept in increasing order in an array('q') next to an
+    array('d') of coefficients. Coefficients are floats; exact coefficients
+    are converted on construction. Instances are immutable.
+    """
+    
+    __slots__ = ('_exponents', '_coeffs')
+    
+    def __init__(self, terms: Union[Dict[int, float], Iterable[Tuple[int, float]]] = ()):
+        """
+        Initialize a sparse polynomial from its terms.
+        
+        Args:
+            terms: Mapping from exponent to coefficient, or (exponent,
+                   coefficient) pairs; repeated exponents are added together.
+                   Example: {1000000: 1, 0: 1} represents x^1000000 + 1
+        """
+        items = terms.items() if isinstance(terms, dict) else terms
+        combined = {}
+        for e, c in items:
+            if not isinstance(e, int) or e < 0:
+                raise ValueError("Exponents must be non-negative integers")
+            combined[e] = combined.get(e, 0.0) + float(c)
+        
+        exponents = array('q')
+        coeffs = array('d')
+        for e in sorted(combined):
+            c = combined[e]
+            if abs(c) >= 1e-10:
+                exponents.append(e)
+                coeffs.append(c)
+        self._exponents = exponents
+        self._coeffs = coeffs
+    
+    @classmethod
+    def _from_arrays(cls, exponents: array, coeffs: array) -> 'SparsePolynomial':
+        """Wrap sorted, non-zero term arrays without copying or checking them."""
+        poly = cls.__new__(cls)
+        poly._exponents = exponents
+        poly._coeffs = coeffs
+        return poly
+    
+    @classmethod
+    def from_dense(cls, poly: Polynomial) -> 'SparsePolynomial':
+        """
+        Create a sparse polynomial from the non-zero coefficients of a Polynomial.
+        
+        Args:
+            poly: The dense polynomial
+            
+        Returns:
+            A SparsePolynomial with the same terms
+        """
+        exponents = array('q')
+        coeffs = array('d')
+        for e, c in enumerate(poly._coeffs):
+            if abs(c) >= 1e-10:
+                exponents.append(e)
+                coeffs.append(c)
+        return cls._from_arrays(exponents, coeffs)
+    
+    def to_dense(self) -> Polynomial:
+        """Return the polynomial as a dense Polynomial (allocates degree + 1 floats)."""
+        return Polynomial._from_array(_dense_array(self._exponents, self._coeffs))
+    
+    def __reduce__(self):
+        """Pickle as a list of (exponent, coefficient) pairs."""
+        return (self.__class__, (self.terms,))
+    
+    @property
+    def terms(self) -> List[Tuple[int, float]]:
+        """Return the (exponent, coefficient) pairs in increasing exponent order."""
+        return list(zip(self._exponents, self._coeffs))
+    
+    @property
+    def degree(self) -> int:
+        """Return the degree of the polynomial."""
+        return self._exponents[-1] if self._exponents else 0
+    
+    @property
+    def fill_ratio(self) -> float:
+        """Return the fraction of the degree + 1 coefficients that are non-zero."""
+        return _fill_ratio(len(self._exponents), self.degree + 1)
+    
+    def __len__(self) -> int:
+        """Return the number of non-zero terms."""
+        return len(self._exponents)
+    
+    def to_string(self, max_terms: Union[int, None] = None) -> str:
+        """
+        Return the polynomial as text, in the same format as Polynomial.
+        
+        Args:
+            max_terms: If given, show only the first and last max_terms terms
+                       with "..." in between
+                       
+        Returns:
+            The formatted polynomial
+        """
+        count = len(self._exponents)
+        if max_terms is not None and count > 2 * max_terms:
+            indices = list(range(max_terms)) + list(range(count - max_terms, count))
+        else:
+            indices = range(count)
+        
+        terms = [_format_term(self._exponents[i], self._coeffs[i], False) for i in indices]
+        if max_terms is not None and count > 2 * max_terms:
+            terms.insert(max_terms, "...")
+        return _join_terms(terms)
+    
+    def __repr__(self) -> str:
+        """Return a string representation of the polynomial."""
+        return self.to_string()
+    
+    def __str__(self) -> str:
+        """Return a string representation of the polynomial."""
+        return self.to_string()
+    
+    def __eq__(self, other) -> bool:
+        """Check if two polynomials (sparse or dense) are equal."""
+        if not isinstance(other, (SparsePolynomial, Polynomial)):
+            return NotImplemented
+        exponents, coeffs = _terms_of(other)
+        if list(self._exponents) != list(exponents):
+            return False
+        return all(abs(a - b) < 1e-10 for a, b in zip(self._coeffs, coeffs))
+    
+    def __add__(self, other: Union['SparsePolynomial', Polynomial, float]) -> Union['SparsePolynomial', Polynomial]:
+        """Add a polynomial (sparse or dense) or a constant."""
+        theirs = _terms_of(other)
+        if theirs is None:
+            return NotImplemented
+        return _result(*_merge(self._exponents, self._coeffs, theirs[0], theirs[1], 1.0))
+    
+    def __radd__(self, other: Union[Polynomial, float]) -> Union['SparsePolynomial', Polynomial]:
+        """Right addition."""
+        return self.__add__(other)
+    
+    def __sub__(self, other: Union['SparsePolynomial', Polynomial, float]) -> Union['SparsePolynomial', Polynomial]:
+        """Subtract a polynomial (sparse or dense) or a constant."""
+        theirs = _terms_of(other)
+        if theirs is None:
+            return NotImplemented
+        return _result(*_merge(self._exponents, self._coeffs, theirs[0], theirs[1], -1.0))
+    
+    def __rsub__(self, other: Union[Polynomial, float]) -> Union['SparsePolynomial', Polynomial]:
+        """Right subtraction."""
+        theirs = _terms_of(other)
+        if theirs is None:
+            return NotImplemented
+        return _result(*_merge(theirs[0], theirs[1], self._exponents, self._coeffs, -1.0))
+    
+    def __mul__(self, other: Union['SparsePolynomial', Polynomial, float]) -> Union['SparsePolynomial', Polynomial]:
+        """
+        Multiply by a polynomial (sparse or dense) or a constant.
+        
+        Term-by-term products cost O(t1*t2) for t1 and t2 non-zero terms. If
+        both operands are dense by fill ratio, the dense multiplication
+        (Karatsuba/FFT) of Polynomial is used instead.
+        """
+        if isinstance(other, _SCALAR_TYPES):
+            if abs(other) < 1e-10:
+                return _result([], [])
+            scale = float(other)
+            return _result(self._exponents, [c * scale for c in self._coeffs])
+        
+        theirs = _terms_of(other)
+        if theirs is None:
+            return NotImplemented
+        e2, c2 = theirs
+        
+        if (_is_dense_fill(len(self._exponents), self.degree + 1)
+                and _is_dense_fill(len(e2), (e2[-1] + 1) if e2 else 1)):
+            return to_best_representation(self.to_dense() * _result(e2, c2))
+        
+        # Iterate the shorter operand in the outer loop
+        e1, c1 = self._exponents, self._coeffs
+        if len(e1) > len(e2):
+            e1, c1, e2, c2 = e2, c2, e1, c1
+        
+        product = {}
+        get = product.get
+        for ea, ca in zip(e1, c1):
+            for eb, cb in zip(e2, c2):
+                e = ea + eb
+                product[e] = get(e, 0.0) + ca * cb
+        
+        return _from_mapping(product)
+    
+    def __rmul__(self, other: Union[Polynomial, float]) -> Union['SparsePolynomial', Polynomial]:
+        """Right multiplication."""
+        return self.__mul__(other)
+    
+    def __pow__(self, n: int) -> Union['SparsePolynomial', Polynomial]:
+        """Raise the polynomial to an integer power by repeated squaring."""
+        if not isinstance(n, int) or n < 0:
+            raise ValueError("Power must be a non-negative integer")
+        
+        # A single term a*x^e stays a single term
+        if len(self._exponents) == 1:
+            return _result([self._exponents[0] * n], [_power(self._coeffs[0], n)])
+        
+        result = _result([0], [1.0])
+        base = self
+        while n > 0:
+            if n % 2 == 1:
+                result = result * base
+            n //= 2
+            if n:
+                base = base * base
+        
+        return result
+    
+    def __call__(self, x: float) -> float:
+        """
+        Evaluate the polynomial at a given value.
+        
+        Horner's method over the non-zero terms only: each step multiplies
+        by x raised to the gap between consecutive exponents. Lists, tuples,
+        array.array and buffers give a list of values; NumPy arrays are
+        evaluated element-wise in one pass.
+        """
+        if _is_batch(x) and not (_np is not None and isinstance(x, _np.ndarray)):
+            return [self(value) for value in x]
+        if isinstance(x, int):
+            # Avoid exact big-integer powers for large exponent gaps
+            x = float(x)
+        
+        exponents = self._exponents
+        coeffs = self._coeffs
+        if not exponents:
+            return 0.0 * x
+        
+        result = coeffs[-1]
+        for i in range(len(exponents) - 2, -1, -1):
+            result = result * _power(x, exponents[i + 1] - exponents[i]) + coeffs[i]
+        
+        if exponents[0]:
+            result = result * _power(x, exponents[0])
+        return result
+    
+    def evaluate(self, x: float) -> float:
+        """
+        Evaluate the polynomial at a given value.
+        
+        Args:
+            x: The value (or container of values) at which to evaluate
+            
+        Returns:
+            The value of the polynomial at x
+        """
+        return self(x)
+    
+    def derivative(self, n: int = 1) -> Union['SparsePolynomial', Polynomial]:
+        """
+        Compute the nth derivative of the polynomial.
+        
+        Args:
+            n: Order of the derivative (default: 1)
+            
+        Returns:
+            The nth derivative
+        """
+        if n < 0:
+            raise ValueError("Derivative order must be non-negative")
+        
+        exponents = []
+        coeffs = []
+        for e, c in zip(self._exponents, self._coeffs):
+            if e < n:
+                continue
+            # Falling factorial e * (e - 1) * ... * (e - n + 1)
+            for k in range(e - n + 1, e + 1):
+                c *= k
+            exponents.append(e - n)
+            coeffs.append(c)
+        
+        return _result(exponents, coeffs)
+    
+    def integrate(self, constant: float = 0.0) -> Union['SparsePolynomial', Polynomial]:
+        """
+        Compute the indefinite integral of the polynomial.
+        
+        Args:
+            constant: The constant of integration (default: 0)
+            
+        Returns:
+            The integral
+        """
+        exponents = [e + 1 for e in self._exponents]
+        coeffs = [c / (e + 1) for e, c in zip(self._exponents, self._coeffs)]
+        if abs(constant) >= 1e-10:
+            exponents.insert(0, 0)
+            coeffs.insert(0, float(constant))
+        return _result(exponents, coeffs)
+    
+    def compose(self, other: Union['SparsePolynomial', Polynomial]) -> Union['SparsePolynomial', Polynomial]:
+        """
+        Compose this polynomial with another: self(other(x)).
+        
+        Uses Horner's method over the non-zero terms, raising other to the
+        gap between consecutive exponents. A single-term inner polynomial
+        a*x^m (e.g. the substitution x -> x^2) only rescales the terms.
+        
+        Args:
+            other: The inner polynomial (sparse or dense)
+            
+        Returns:
+            The composed polynomial
+        """
+        if not isinstance(other, (SparsePolynomial, Polynomial)):
+            raise TypeError("Can only compose with another polynomial")
+        
+        inner_exponents, inner_coeffs = _terms_of(other)
+        exponents = self._exponents
+        coeffs = self._coeffs
+        
+        if not exponents:
+            return _result([], [])
+        if not inner_exponents:
+            return _result([0], [self(0.0)])
+        if len(inner_exponents) == 1:
+            m, a = inner_exponents[0], inner_coeffs[0]
+            if m == 0:
+                return _result([0], [self(a)])
+            return _result([e * m for e in exponents],
+                           [c * _power(a, e) for e, c in zip(exponents, coeffs)])
+        
+        inner = _result(inner_exponents, inner_coeffs)
+        result = _result([0], [coeffs[-1]])
+        for i in range(len(exponents) - 2, -1, -1):
+            result = result * inner ** (exponents[i + 1] - exponents[i]) + coeffs[i]
+        
+        if exponents[0]:
+            result = result * inner ** exponents[0]
+        return result
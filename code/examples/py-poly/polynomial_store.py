@@ -0,0 +1,149 @@
+"""
+Memory-Mapped Polynomial Store
+
+A single file holding any number of polynomials in the binary format of
+Polynomial.to_bytes(), with an index of record offsets at the end. Opening a
+store maps the file without reading it; each polynomial is decoded on access
+as a zero-copy view of the mapped pages, so only the records actually used
+are ever loaded from disk.
+
+File layout (little-endian):
+    header   magic b'PLYS', version, count, index offset (24 bytes)
+    records  count Polynomial.to_bytes() records, each 8-byte aligned
+    index    count uint64 record offsets
+"""
+
+from typing import Iterable, Iterator
+from array import array
+import mmap
+import struct
+import sys
+
+from polynomial import Polynomial
+
+
+_STORE_HEADER = struct.Struct('<4sB3xQQ')
+_STORE_MAGIC = b'PLYS'
+_STORE_VERSION = 1
+
+
+class PolynomialStore:
+    """
+    Read-only, memory-mapped collection of polynomials.
+    
+    Example:
+        >>> PolynomialStore.write('catalog.plys', polynomials)
+        >>> with PolynomialStore('catalog.plys') as store:
+        ...     p = store[123456]    # reads only that record's pages
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open a store written by PolynomialStore.write().
+        
+        Args:
+            path: Path of the store file
+        """
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        view = memoryview(self._mmap)
+        if len(view) < _STORE_HEADER.size:
+            raise ValueError("Truncated polynomial store")
+        magic, version, count, index_offset = _STORE_HEADER.unpack_from(view)
+        if magic != _STORE_MAGIC:
+            raise ValueError("Not a polynomial store")
+        if version != _STORE_VERSION:
+            raise ValueError(f"Unsupported polynomial store version {version}")
+        if index_offset + 8 * count > len(view):
+            raise ValueError("Truncated polynomial store")
+        
+        index = view[index_offset:index_offset + 8 * count]
+        if sys.byteorder == 'big':
+            offsets = array('Q')
+            offsets.frombytes(index)
+            offsets.byteswap()
+            self._offsets = offsets
+        else:
+            self._offsets = index.cast('Q')
+        self._view = view
+        self._count = count
+    
+    @staticmethod
+    def write(path: str, polynomials: Iterable[Polynomial]) -> int:
+        """
+        Write polynomials to a new store file, streaming them to disk.
+        
+        Args:
+            path: Path of the store file (overwritten if it exists)
+            polynomials: Any iterable of polynomials
+            
+        Returns:
+            The number of polynomials written
+        """
+        offsets = array('Q')
+        with open(path, 'wb') as file:
+            file.write(_STORE_HEADER.pack(_STORE_MAGIC, _STORE_VERSION, 0, 0))
+            position = _STORE_HEADER.size
+            for poly in polynomials:
+                record = poly.to_bytes()
+                offsets.append(position)
+                file.write(record)
+                position += len(record)
+            
+            if sys.byteorder == 'big':
+                offsets.byteswap()
+            file.write(offsets.tobytes())
+            file.seek(0)
+            file.write(_STORE_HEADER.pack(_STORE_MAGIC, _STORE_VERSION, len(offsets), position))
+        
+        return len(offsets)
+    
+    def __len__(self) -> int:
+        """Return the number of polynomials in the store."""
+        return self._count
+    
+    def __getitem__(self, index: int) -> Polynomial:
+        """
+        Return the polynomial at index without copying its coefficients.
+        
+        Float polynomials are read-only views of the mapping; in-place
+        operators copy before writing.
+        """
+        if self._view is None:
+            raise ValueError("Polynomial store is closed")
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Polynomial store index out of range")
+        return Polynomial.from_bytes(self._view[self._offsets[index]:])
+    
+    def __iter__(self) -> Iterator[Polynomial]:
+        """Iterate over the polynomials in order."""
+        for i in range(self._count):
+            yield self[i]
+    
+    def close(self) -> None:
+        """
+        Release the mapping.
+        
+        Polynomials read from the store stay valid: the file stays mapped
+        until the last of them is garbage collected.
+        """
+        if self._view is None:
+            return
+        self._offsets = None
+        self._view.release()
+        self._view = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Still referenced by polynomials; unmapped when they are freed
+            pass
+        self._mmap = None
+    
+    def __enter__(self) -> 'PolynomialStore':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,285 @@
+import mmap
+import struct
+import sys
+
+from grid_paths import PackedGrid, _wall_bytes
+
+# Bit-packed 0/1 grids (1 = wall). Each row is stored as ceil(cols / 8) bytes, bit
+# c % 8 of byte c // 8 holding column c, so a grid takes one bit per cell instead of
+# a list pointer per cell. Grids can live in a bytearray or in a memory-mapped file.
+# Iterating a Grid yields row objects that behave like the lists in a list-of-lists
+# grid, so render_maze_with_walls and grid_paths accept a Grid wherever they accept
+# nested lists.
+
+# File layout: header (magic b'GRID', version, rows, cols; 24 bytes, little-endian)
+# followed by the packed rows
+_GRID_HEADER = struct.Struct("<4sB3xQQ")
+_GRID_MAGIC = b"GRID"
+_GRID_VERSION = 1
+
+# Packed byte -> its 8 cells as 0/1 bytes, and back (keyed by the 8 cells read as
+# one native-endian 64-bit integer)
+_UNPACK = [bytes((b >> k) & 1 for k in range(8)) for b in range(256)]
+_PACK = {int.from_bytes(cells, sys.byteorder): b for b, cells in enumerate(_UNPACK)}
+
+def _pack_row(cells, stride):
+    # Pack a row of 0/1 bytes into stride bytes
+    padded = bytes(cells) + bytes(8 * stride - len(cells))
+    return bytes(map(_PACK.__getitem__, memoryview(padded).cast("Q")))
+
+class GridRow:
+    # One row of a Grid or grid view; indexing and iteration give 0/1 ints, without
+    # copying the row out of the grid
+
+    __slots__ = ("_grid", "_r")
+
+    def __init__(self, grid, r):
+        self._grid = grid
+        self._r = r
+
+    def __len__(self):
+        return self._grid.cols
+
+    def __getitem__(self, c):
+        if isinstance(c, slice):
+            return list(self.tobytes()[c])
+        return self._grid[self._r, c]
+
+    def __setitem__(self, c, value):
+        self._grid[self._r, c] = value
+
+    def __iter__(self):
+        return iter(self.tobytes())
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"GridRow({list(self)})"
+
+    def tobytes(self):
+        # The row as 0/1 bytes, one per cell
+        return self._grid._unpacked_row(self._r)
+
+    def count(self, value=1):
+        # Number of cells equal to value (walls by default)
+        walls = self._grid._row_bits(self._r).bit_count()
+        return walls if value == 1 else len(self) - walls if value == 0 else 0
+
+class Grid:
+    # Bit-packed grid of 0/1 cells with O(1) cell access. view() returns sub-rectangles
+    # that share storage with the grid; changes through either are visible in both.
+
+    __slots__ = ("_data", "_stride", "_row0", "_col0", "rows", "cols", "_mmap")
+
+    def __init__(self, rows, cols):
+        # An all-open grid in memory
+        if rows < 1 or cols < 1:
+            raise ValueError("Grid must have at least one row and one column")
+        self._stride = (cols + 7) // 8
+        self._data = bytearray(rows * self._stride)
+        self._row0 = self._col0 = 0
+        self.rows = rows
+        self.cols = cols
+        self._mmap = None
+
+    @classmethod
+    def from_rows(cls, rows):
+        # Pack a list of 0/1 rows (any value other than 1 is open)
+        rows = list(rows)
+        grid = cls(len(rows), len(rows[0]) if rows else 0)
+        stride = grid._stride
+        for r, row in enumerate(rows):
+            if len(row) != grid.cols:
+                raise ValueError("All grid rows must have the same length")
+            grid._data[r * stride:(r + 1) * stride] = _pack_row(_wall_bytes(row), stride)
+        return grid
+
+    @classmethod
+    def from_packed(cls, packed):
+        # Pack a grid_paths.PackedGrid (one byte per cell)
+        grid = cls(packed.rows, packed.cols)
+        stride, cols = grid._stride, packed.cols
+        cells = memoryview(packed.cells)
+        for r in range(packed.rows):
+            grid._data[r * stride:(r + 1) * stride] = _pack_row(cells[r * cols:(r + 1) * cols], stride)
+        return grid
+
+    def to_packed(self):
+        # Unpack to a grid_paths.PackedGrid, the layout the path finders search
+        cells = bytearray(b"".join(map(self._unpacked_row, range(self.rows))))
+        return PackedGrid(cells, self.rows, self.cols)
+
+    def to_rows(self):
+        # Copy out as a list of 0/1 lists
+        return [list(self._unpacked_row(r)) for r in range(self.rows)]
+
+    @property
+    def shape(self):
+        return self.rows, self.cols
+
+    def __len__(self):
+        return self.rows
+
+    def __iter__(self):
+        for r in range(self.rows):
+            yield GridRow(self, r)
+
+    def __repr__(self):
+        return f"Grid(rows={self.rows}, cols={self.cols})"
+
+    def __eq__(self, other):
+        if isinstance(other, Grid):
+            return self.shape == other.shape and all(
+                self._row_bits(r) == other._row_bits(r) for r in range(self.rows))
+        return NotImplemented
+
+    def _locate(self, r, c):
+        # Byte index and bit mask of cell (r, c)
+        if r < 0:
+            r += self.rows
+        if c < 0:
+            c += self.cols
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise IndexError("Grid index out of range")
+        c += self._col0
+        return (self._row0 + r) * self._stride + (c >> 3), 1 << (c & 7)
+
+    def __getitem__(self, index):
+        # grid[r, c] is a cell, grid[r] a GridRow, so grid[r][c] works as for lists
+        if isinstance(index, tuple):
+            i, mask = self._locate(*index)
+            return 1 if self._data[i] & mask else 0
+        if index < 0:
+            index += self.rows
+        if not 0 <= index < self.rows:
+            raise IndexError("Grid index out of range")
+        return GridRow(self, index)
+
+    def __setitem__(self, index, value):
+        i, mask = self._locate(*index)
+        if value == 1:
+            self._data[i] |= mask
+        else:
+            self._data[i] &= 0xFF ^ mask
+
+    def view(self, row, col, rows, cols):
+        # The rows x cols sub-rectangle starting at (row, col), sharing storage
+        if rows < 1 or cols < 1 or row < 0 or col < 0 or row + rows > self.rows or col + cols > self.cols:
+            raise IndexError("View does not fit inside the grid")
+        view = Grid.__new__(Grid)
+        view._data = self._data
+        view._stride = self._stride
+        view._row0 = self._row0 + row
+        view._col0 = self._col0 + col
+        view.rows = rows
+        view.cols = cols
+        view._mmap = None
+        return view
+
+    def _row_bits(self, r):
+        # Row r as an int, bit c set for a wall in column c
+        start = (self._row0 + r) * self._stride
+        first, last = self._col0 >> 3, (self._col0 + self.cols + 7) >> 3
+        bits = int.from_bytes(self._data[start + first:start + last], "little")
+        return (bits >> (self._col0 & 7)) & ((1 << self.cols) - 1)
+
+    def _unpacked_row(self, r):
+        # Row r as 0/1 bytes
+        start = (self._row0 + r) * self._stride
+        first, last = self._col0 >> 3, (self._col0 + self.cols + 7) >> 3
+        cells = b"".join(map(_UNPACK.__getitem__, self._data[start + first:start + last]))
+        shift = self._col0 & 7
+        return cells[shift:shift + self.cols]
+
+    def row_counts(self):
+        # Number of walls in each row
+        return [self._row_bits(r).bit_count() for r in range(self.rows)]
+
+    def column_counts(self):
+        # Number of walls in each column. Up to 255 unpacked rows are summed as big
+        # integers with one byte lane per column before a lane can overflow.
+        totals = [0] * self.cols
+        for first in range(0, self.rows, 255):
+            lanes = sum(int.from_bytes(self._unpacked_row(r), "little")
+                        for r in range(first, min(first + 255, self.rows)))
+            totals = list(map(int.__add__, totals, lanes.to_bytes(self.cols, "little")))
+        return totals
+
+    def count(self, value=1):
+        # Number of cells equal to value (walls by default)
+        walls = sum(self.row_counts())
+        return walls if value == 1 else self.rows * self.cols - walls if value == 0 else 0
+
+    def save(self, path):
+        # Write the grid (or view) to a file that load() maps back without reading it
+        with open(path, "wb") as file:
+            file.write(_GRID_HEADER.pack(_GRID_MAGIC, _GRID_VERSION, self.rows, self.cols))
+            # Row by row, so views and maps larger than memory are written with the
+            # padding bits cleared and without building the whole file
+            stride = (self.cols + 7) // 8
+            for r in range(self.rows):
+                file.write(self._row_bits(r).to_bytes(stride, "little"))
+
+    @classmethod
+    def load(cls, path, writable=False):
+        # Memory-map a file written by save() or create(); pages are read on access.
+        # With writable=True, changes to the grid are written to the file.
+        with open(path, "r+b" if writable else "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+
+        magic, version, rows, cols = _GRID_HEADER.unpack_from(mapping)
+        if magic != _GRID_MAGIC:
+            raise ValueError("Not a grid file")
+        if version != _GRID_VERSION:
+            raise ValueError(f"Unsupported grid file version {version}")
+        stride = (cols + 7) // 8
+        if len(mapping) < _GRID_HEADER.size + rows * stride:
+            raise ValueError("Truncated grid file")
+
+        grid = cls.__new__(cls)
+        grid._data = memoryview(mapping)[_GRID_HEADER.size:_GRID_HEADER.size + rows * stride]
+        grid._stride = stride
+        grid._row0 = grid._col0 = 0
+        grid.rows = rows
+        grid.cols = cols
+        grid._mmap = mapping
+        return grid
+
+    @classmethod
+    def create(cls, path, rows, cols):
+        # Create an all-open grid file of any size and map it writable; the file is
+        # sparse until cells are set, so maps larger than memory can be built in place
+        if rows < 1 or cols < 1:
+            raise ValueError("Grid must have at least one row and one column")
+        with open(path, "wb") as file:
+            file.write(_GRID_HEADER.pack(_GRID_MAGIC, _GRID_VERSION, rows, cols))
+            file.truncate(_GRID_HEADER.size + rows * ((cols + 7) // 8))
+        return cls.load(path, writable=True)
+
+    def close(self):
+        # Release the mapping of a grid opened with load() or create(); views taken from
+        # it must not be used afterwards
+        if self._mmap is None:
+            return
+        self._data.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Still referenced by a view; unmapped when it is freed
+            pass
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def as_grid(grid):
+    # Accept a Grid, a PackedGrid or a list of 0/1 rows and return a Grid
+    if isinstance(grid, Grid):
+        return grid
+    if isinstance(grid, PackedGrid):
+        return Grid.from_packed(grid)
+    return Grid.from_rows(grid)
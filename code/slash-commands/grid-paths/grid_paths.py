@@ -0,0 +1,198 @@
+import heapq
+from array import array
+from collections import namedtuple
+
+# Path finding over 0/1 maze grids (1 = wall), as drawn by render_maze_with_walls.
+# Grids are stored as one flat bytearray (one byte per cell, row-major) instead of
+# nested lists. Per-cell search state is a few bytes; A* also keeps its heap of
+# frontier entries, which dominates memory when the frontier gets large.
+# Coordinates are (row, col); moves go up, down, left and right.
+
+PackedGrid = namedtuple("PackedGrid", "cells rows cols")
+
+# Searches store per cell the direction code (1-4, an index into the steps tuple)
+# of the move that reached it; the start cell gets _START
+_START = 5
+
+# Byte translation table mapping every nonzero byte to 1
+_NONZERO = bytes([0]) + bytes([1]) * 255
+
+def _wall_bytes(row):
+    # One byte per cell, 1 for walls; int, float, bool and NumPy cells all compare with == 1
+    return bytes([1 if v == 1 else 0 for v in row])
+
+def pack_grid(grid):
+    # Convert a list of rows to a PackedGrid; PackedGrid input is returned as is and
+    # bit-packed grids (grid.Grid) unpack themselves
+    if isinstance(grid, PackedGrid):
+        return grid
+    if hasattr(grid, "to_packed"):
+        return grid.to_packed()
+    cells = bytearray()
+    cols = None
+    for row in grid:
+        if cols is None:
+            cols = len(row)
+        elif len(row) != cols:
+            raise ValueError("All grid rows must have the same length")
+        cells += _wall_bytes(row)
+    if not cells:
+        raise ValueError("Grid must have at least one cell")
+    return PackedGrid(cells, len(cells) // cols, cols)
+
+def unpack_grid(packed):
+    # Convert a PackedGrid back to a list of 0/1 rows
+    cols = packed.cols
+    return [list(packed.cells[r * cols:(r + 1) * cols]) for r in range(packed.rows)]
+
+def _padded(packed):
+    # Copy the grid inside a one-cell wall border, so neighbours never need bounds checks
+    width = packed.cols + 2
+    blocked = bytearray(b"\x01") * ((packed.rows + 2) * width)
+    for r in range(packed.rows):
+        start = (r + 1) * width + 1
+        blocked[start:start + packed.cols] = packed.cells[r * packed.cols:(r + 1) * packed.cols]
+    return blocked, width
+
+def _index(packed, width, point):
+    r, c = point
+    if not (0 <= r < packed.rows and 0 <= c < packed.cols):
+        raise ValueError(f"{point} is outside the grid")
+    return (r + 1) * width + c + 1
+
+def _path(came, steps, width, goal):
+    # Walk the direction codes back from goal to the start
+    path = []
+    i = goal
+    while came[i] != _START:
+        path.append((i // width - 1, i % width - 1))
+        i -= steps[came[i] - 1]
+    path.append((i // width - 1, i % width - 1))
+    path.reverse()
+    return path
+
+def _flood(blocked, width, start, goal=None):
+    # Breadth-first search; marks visited cells in blocked and returns the direction codes
+    steps = (-width, width, -1, 1)
+    came = bytearray(len(blocked))
+    came[start] = _START
+    blocked[start] = 1
+    frontier = [start]
+    while frontier:
+        if goal is not None and came[goal]:
+            break
+        next_frontier = []
+        for i in frontier:
+            for code, step in enumerate(steps, 1):
+                j = i + step
+                if not blocked[j]:
+                    blocked[j] = 1
+                    came[j] = code
+                    next_frontier.append(j)
+        frontier = next_frontier
+    return came, steps
+
+def bfs_path(grid, start, goal):
+    # Shortest path by breadth-first search, as a list of (row, col), or None
+    packed = pack_grid(grid)
+    blocked, width = _padded(packed)
+    s, g = _index(packed, width, start), _index(packed, width, goal)
+    if blocked[s] or blocked[g]:
+        return None
+    came, steps = _flood(blocked, width, s, g)
+    return _path(came, steps, width, g) if came[g] else None
+
+def astar_path(grid, start, goal):
+    # Shortest path by A* with a binary heap and the Manhattan distance heuristic.
+    # Explores far fewer cells than BFS when the goal is not boxed in. Search state is
+    # 6 bytes per cell (grid copy, direction codes, int32 costs) plus the heap, which
+    # holds one (f, h, cell) tuple of boxed ints, roughly 100 bytes, per queued entry.
+    packed = pack_grid(grid)
+    blocked, width = _padded(packed)
+    s, g = _index(packed, width, start), _index(packed, width, goal)
+    if blocked[s] or blocked[g]:
+        return None
+
+    steps = (-width, width, -1, 1)
+    goal_r, goal_c = divmod(g, width)
+    came = bytearray(len(blocked))
+    cost = array("i", [-1]) * len(blocked)   # best known distance from start, -1 = unseen
+    came[s] = _START
+    cost[s] = 0
+    h = abs(s // width - goal_r) + abs(s % width - goal_c)
+    heap = [(h, h, s)]   # (estimated total, remaining estimate, cell); ties prefer cells nearer the goal
+
+    while heap:
+        f, h, i = heapq.heappop(heap)
+        if blocked[i]:
+            continue   # already expanded through a shorter entry
+        if i == g:
+            return _path(came, steps, width, g)
+        blocked[i] = 1
+        g_next = f - h + 1
+        for code, step in enumerate(steps, 1):
+            j = i + step
+            if not blocked[j] and (cost[j] < 0 or g_next < cost[j]):
+                cost[j] = g_next
+                came[j] = code
+                h_j = abs(j // width - goal_r) + abs(j % width - goal_c)
+                heapq.heappush(heap, (g_next + h_j, h_j, j))
+    return None
+
+# Default shortest-path solver
+shortest_path = astar_path
+
+def reachable(grid, start, goal):
+    # True if goal can be reached from start
+    packed = pack_grid(grid)
+    blocked, width = _padded(packed)
+    s, g = _index(packed, width, start), _index(packed, width, goal)
+    if blocked[s] or blocked[g]:
+        return False
+    came, _ = _flood(blocked, width, s, g)
+    return bool(came[g])
+
+def reachable_cells(grid, start):
+    # Row-major bytearray mask (1 = reachable from start) with one byte per cell
+    packed = pack_grid(grid)
+    blocked, width = _padded(packed)
+    s = _index(packed, width, start)
+    mask = bytearray(packed.rows * packed.cols)
+    if blocked[s]:
+        return mask
+    came, _ = _flood(blocked, width, s)
+    for r in range(packed.rows):
+        start_index = (r + 1) * width + 1
+        # Direction codes are 1..5; reduce them to 0/1
+        mask[r * packed.cols:(r + 1) * packed.cols] = came[start_index:start_index + packed.cols].translate(_NONZERO)
+    return mask
+
+def count_monotone_paths(grid, start=(0, 0), goal=None, modulus=None):
+    # Number of paths from start to goal that only move right or down, avoiding walls.
+    # Dynamic programming over rows keeps one row of counts in memory; pass a modulus
+    # to keep the counts small on large grids.
+    packed = pack_grid(grid)
+    if goal is None:
+        goal = (packed.rows - 1, packed.cols - 1)
+    (r0, c0), (r1, c1) = start, goal
+    for r, c in (start, goal):
+        if not (0 <= r < packed.rows and 0 <= c < packed.cols):
+            raise ValueError(f"{(r, c)} is outside the grid")
+    if r1 < r0 or c1 < c0:
+        return 0
+
+    cols = packed.cols
+    ways = [0] * (c1 - c0 + 1)
+    ways[0] = 1
+    for r in range(r0, r1 + 1):
+        walls = packed.cells[r * cols + c0:r * cols + c1 + 1]
+        left = 0
+        for c, wall in enumerate(walls):
+            if wall:
+                left = 0
+            else:
+                left += ways[c]
+                if modulus is not None:
+                    left %= modulus
+            ways[c] = left
+    return ways[-1]
@@ -0,0 +1,122 @@
+import argparse
+import random
+import time
+from array import array
+
+from grid_paths import PackedGrid, unpack_grid
+
+# Random perfect mazes in the 0/1 grid format (1 = wall) used by render_maze_with_walls
+# and grid_paths. Maze cells sit at even (row, col) positions of the grid and the cells
+# between them are walls until a passage is carved, so (0, 0) is always open and, for
+# odd sizes, so is (rows - 1, cols - 1). Both algorithms are iterative and work on one
+# flat bytearray, so millions of cells need neither recursion nor nested lists.
+
+def _blank(rows, cols):
+    # All walls, except the maze cells at even coordinates
+    if rows < 1 or cols < 1:
+        raise ValueError("Maze must have at least one row and one column")
+    cells = bytearray(b"\x01") * (rows * cols)
+    open_row = bytes((cols + 1) // 2)
+    for r in range(0, rows, 2):
+        cells[r * cols:(r + 1) * cols:2] = open_row
+    return cells
+
+def _backtracker(cells, rows, cols, rng):
+    # Depth-first search with an explicit stack; long winding corridors
+    h, w = (rows + 1) // 2, (cols + 1) // 2
+    visited = bytearray(h * w)
+    start = int(rng.random() * h * w)
+    visited[start] = 1
+    stack = array("i", [start])
+    position = array("i", [2 * (start // w) * cols + 2 * (start % w)])   # grid index per stack entry
+
+    while stack:
+        cell = stack[-1]
+        i, j = divmod(cell, w)
+        options = []
+        if i > 0 and not visited[cell - w]:
+            options.append((cell - w, -2 * cols))
+        if i < h - 1 and not visited[cell + w]:
+            options.append((cell + w, 2 * cols))
+        if j > 0 and not visited[cell - 1]:
+            options.append((cell - 1, -2))
+        if j < w - 1 and not visited[cell + 1]:
+            options.append((cell + 1, 2))
+        if not options:
+            stack.pop()
+            position.pop()
+            continue
+
+        nxt, step = options[int(rng.random() * len(options))]
+        visited[nxt] = 1
+        here = position[-1]
+        cells[here + step // 2] = 0   # knock down the wall between the two cells
+        stack.append(nxt)
+        position.append(here + step)
+
+def _kruskal(cells, rows, cols, rng):
+    # Random spanning tree by union-find over shuffled walls; many short dead ends
+    h, w = (rows + 1) // 2, (cols + 1) // 2
+    n = h * w
+    # Wall id = cell * 2 + direction (0: to the right neighbour, 1: to the one below)
+    walls = array("i", (cell * 2 for cell in range(n) if cell % w < w - 1))
+    walls.extend(cell * 2 + 1 for cell in range(n - w))
+    walls = walls.tolist()
+    rng.shuffle(walls)
+
+    parent = array("i", range(n))
+    size = array("i", [1]) * n
+    remaining = n - 1
+    for wall in walls:
+        a = wall >> 1
+        b = a + w if wall & 1 else a + 1
+        # Find both roots with path halving
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        if size[a] < size[b]:
+            a, b = b, a
+        parent[b] = a
+        size[a] += size[b]
+
+        cell = wall >> 1
+        i, j = divmod(cell, w)
+        cells[2 * i * cols + 2 * j + (cols if wall & 1 else 1)] = 0
+        remaining -= 1
+        if not remaining:
+            break
+
+ALGORITHMS = {"backtracker": _backtracker, "kruskal": _kruskal}
+
+def generate_maze(rows, cols, seed=None, algorithm="backtracker"):
+    # Random maze as a PackedGrid; the same seed always gives the same maze
+    cells = _blank(rows, cols)
+    ALGORITHMS[algorithm](cells, rows, cols, random.Random(seed))
+    return PackedGrid(cells, rows, cols)
+
+def generate_maze_rows(rows, cols, seed=None, algorithm="backtracker"):
+    # Random maze as a list of 0/1 rows, ready for render_maze_with_walls
+    return unpack_grid(generate_maze(rows, cols, seed, algorithm))
+
+def benchmark(rows, cols, seed=0, algorithms=tuple(ALGORITHMS)):
+    # Generate one maze per algorithm and return {algorithm: cells per second}
+    rates = {}
+    for name in algorithms:
+        start = time.perf_counter()
+        generate_maze(rows, cols, seed, name)
+        rates[name] = rows * cols / (time.perf_counter() - start)
+    return rates
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark maze generation")
+    parser.add_argument("--size", type=int, default=2001, help="rows and columns of the grid")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for name, rate in benchmark(args.size, args.size, args.seed).items():
+        print(f"{name:<12} {args.size}x{args.size}: {rate:,.0f} cells/s")